@@ -19,15 +19,25 @@ Author: Project Elysian Fields Development Team
 import os
 import json
 import uuid
-from datetime import datetime
+import tempfile
+import hashlib
+import mimetypes
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date
 from pathlib import Path
 import zipfile
-import xml.etree.ElementTree as ET
+from io import BytesIO
 
-from flask import Flask, request, jsonify, send_file, send_from_directory
+from flask import Flask, Response, request, jsonify, send_file, send_from_directory, url_for, g, has_request_context
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, func, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 from werkzeug.utils import secure_filename
+from werkzeug.security import safe_join
+from lxml import etree
 import pytesseract
 from PIL import Image
 import cv2
@@ -47,12 +57,66 @@ CORS(app)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-here')
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///elysian_fields.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Send executemany INSERTs (bulk plot imports) as multi-row statements, 1000 rows per round trip
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'insertmanyvalues_page_size': 1000}
+if app.config['SQLALCHEMY_DATABASE_URI'].startswith('postgresql'):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS']['executemany_mode'] = 'values_plus_batch'
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 500 * 1024 * 1024  # 500MB max file size
+# When set (e.g. /internal/uploads), uploads are served by the front-end proxy via X-Accel-Redirect
+app.config['X_ACCEL_REDIRECT_PREFIX'] = os.getenv('X_ACCEL_REDIRECT_PREFIX', '')
+app.config['OCR_TARGET_HEIGHT'] = int(os.getenv('OCR_TARGET_HEIGHT', 800))  # Image height (px) fed to Tesseract
+# Development guard: warn about any request that runs more SQL statements than this (0 disables)
+app.config['SQL_QUERY_LIMIT'] = int(os.getenv('SQL_QUERY_LIMIT', 0))
+
+PHOTO_EXTENSIONS = {'jpg', 'jpeg', 'png', 'bmp', 'tiff', 'tif'}
+
+# Leading bytes of the image formats we accept, checked before PIL/Tesseract see the file
+IMAGE_SIGNATURES = (
+    b'\xff\xd8\xff',        # JPEG
+    b'\x89PNG\r\n\x1a\n',   # PNG
+    b'II*\x00',             # TIFF (little-endian)
+    b'MM\x00*',             # TIFF (big-endian)
+    b'BM',                  # BMP
+)
+PHOTO_FORMATS = ('JPEG', 'PNG', 'TIFF', 'BMP')
+
+# LSTM engine only, and treat the image as a single uniform block of text
+OCR_CONFIG = '--oem 1 --psm 6'
+
+# Read size when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+KML_NS = '{http://www.opengis.net/kml/2.2}'
+
+# Page size for list endpoints; ?per_page= may lower it but never raise it
+MAX_PAGE_SIZE = 500
+
+# Images per Tesseract invocation in batch OCR; very long image lists can stall the output pipe
+OCR_BATCH_SIZE = 50
 
 # Initialize extensions
 db = SQLAlchemy(app)
 
+# Background OCR workers, so photo uploads return before Tesseract finishes
+ocr_executor = ThreadPoolExecutor(max_workers=int(os.getenv('OCR_WORKERS', 2)))
+
+# Count SQL statements per request so N+1 lazy loads show up in development
+if app.config['SQL_QUERY_LIMIT']:
+    @event.listens_for(Engine, 'before_cursor_execute')
+    def count_request_queries(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context():
+            g.query_count = g.get('query_count', 0) + 1
+    
+    @app.after_request
+    def check_query_count(response):
+        query_count = g.get('query_count', 0)
+        if query_count > app.config['SQL_QUERY_LIMIT']:
+            # Warn rather than fail: the response is already built and any writes are committed
+            print(f"Query limit warning: {request.method} {request.path} ran {query_count} SQL queries "
+                  f"(limit {app.config['SQL_QUERY_LIMIT']}); check for N+1 lazy loads")
+        return response
+
 # Initialize Google Maps integration
 map_manager = CemeteryMapManager()
 
@@ -85,8 +149,8 @@ class Cemetery(db.Model):
 class Plot(db.Model):
     """Individual plot/grave information"""
     id = db.Column(db.Integer, primary_key=True)
-    cemetery_id = db.Column(db.Integer, db.ForeignKey('cemetery.id'), nullable=False)
-    plot_number = db.Column(db.String(50), nullable=False)
+    cemetery_id = db.Column(db.Integer, db.ForeignKey('cemetery.id'), nullable=False)  # Indexed by unique_plot_per_cemetery
+    plot_number = db.Column(db.String(50), nullable=False, index=True)
     section = db.Column(db.String(50))
     row = db.Column(db.String(50))
     latitude = db.Column(db.Float)
@@ -105,8 +169,8 @@ class Plot(db.Model):
 class Individual(db.Model):
     """Individual person information"""
     id = db.Column(db.Integer, primary_key=True)
-    plot_id = db.Column(db.Integer, db.ForeignKey('plot.id'), nullable=False)
-    name = db.Column(db.String(200), nullable=False)
+    plot_id = db.Column(db.Integer, db.ForeignKey('plot.id'), nullable=False, index=True)
+    name = db.Column(db.String(200), nullable=False, index=True)
     born_date = db.Column(db.Date)
     died_date = db.Column(db.Date)
     epitaph = db.Column(db.Text)
@@ -117,12 +181,13 @@ class Individual(db.Model):
 class Photo(db.Model):
     """Photo metadata"""
     id = db.Column(db.Integer, primary_key=True)
-    plot_id = db.Column(db.Integer, db.ForeignKey('plot.id'), nullable=False)
+    plot_id = db.Column(db.Integer, db.ForeignKey('plot.id'), nullable=False, index=True)
     filename = db.Column(db.String(255), nullable=False)
     file_path = db.Column(db.String(500), nullable=False)
     photo_type = db.Column(db.String(50))  # headstone, 360, blueprint, etc.
     ocr_text = db.Column(db.Text)
     ocr_confidence = db.Column(db.Float)
+    ocr_status = db.Column(db.String(20))  # pending, complete
     file_size = db.Column(db.Integer)
     width = db.Column(db.Integer)
     height = db.Column(db.Integer)
@@ -131,29 +196,392 @@ class Photo(db.Model):
 class Blueprint(db.Model):
     """Cemetery blueprint/map information"""
     id = db.Column(db.Integer, primary_key=True)
-    cemetery_id = db.Column(db.Integer, db.ForeignKey('cemetery.id'), nullable=False)
+    cemetery_id = db.Column(db.Integer, db.ForeignKey('cemetery.id'), nullable=False, index=True)
     filename = db.Column(db.String(255), nullable=False)
     file_path = db.Column(db.String(500), nullable=False)
     description = db.Column(db.Text)
     scale = db.Column(db.Float)  # Scale factor for the blueprint
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+# Search indexes for substring (ILIKE '%q%') search, which btree indexes can't serve
+SEARCH_INDEX_DDL = {
+    'postgresql': [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS idx_individual_name_trgm ON individual USING gin (name gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS idx_plot_number_trgm ON plot USING gin (plot_number gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS idx_cemetery_name_trgm ON cemetery USING gin (name gin_trgm_ops)",
+    ],
+    'sqlite': [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS individual_fts USING fts5("
+        "name, content='individual', content_rowid='id', tokenize='trigram')",
+        "CREATE TRIGGER IF NOT EXISTS individual_fts_ai AFTER INSERT ON individual BEGIN "
+        "INSERT INTO individual_fts(rowid, name) VALUES (new.id, new.name); END",
+        "CREATE TRIGGER IF NOT EXISTS individual_fts_ad AFTER DELETE ON individual BEGIN "
+        "INSERT INTO individual_fts(individual_fts, rowid, name) VALUES ('delete', old.id, old.name); END",
+        "CREATE TRIGGER IF NOT EXISTS individual_fts_au AFTER UPDATE ON individual BEGIN "
+        "INSERT INTO individual_fts(individual_fts, rowid, name) VALUES ('delete', old.id, old.name); "
+        "INSERT INTO individual_fts(rowid, name) VALUES (new.id, new.name); END",
+        "INSERT INTO individual_fts(individual_fts) VALUES ('rebuild')",
+    ],
+}
+
+# The trigram tokenizer can't match queries shorter than one trigram
+FTS_MIN_QUERY_LENGTH = 3
+
+_individual_fts_available = None
+
+def setup_search_indexes():
+    """Create trigram (PostgreSQL) or FTS5 (SQLite) indexes used by /api/search"""
+    global _individual_fts_available
+    statements = SEARCH_INDEX_DDL.get(db.engine.dialect.name, [])
+    try:
+        with db.engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+        _individual_fts_available = None
+    except Exception as e:
+        print(f"Search index setup error: {str(e)}")
+
+def individual_fts_available():
+    """Check (once) whether the SQLite individual_fts table exists"""
+    global _individual_fts_available
+    if _individual_fts_available is None:
+        _individual_fts_available = False
+        if db.engine.dialect.name == 'sqlite':
+            result = db.session.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='individual_fts'"
+            )).first()
+            _individual_fts_available = result is not None
+    return _individual_fts_available
+
 # Utility Functions
 def allowed_file(filename, allowed_extensions):
     """Check if file extension is allowed"""
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in allowed_extensions
 
+def is_image_file(file):
+    """Check the upload's magic bytes, leaving the stream at the start"""
+    header = file.stream.read(8)
+    file.stream.seek(0)
+    return header.startswith(IMAGE_SIGNATURES)
+
+# Directories already created by this process, so uploads skip the makedirs syscalls
+_ensured_dirs = set()
+
+def ensure_dir(path):
+    """Create a directory once per process"""
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+def individual_counts_subquery():
+    """Per-plot individual counts, for joining instead of len(plot.individuals)"""
+    return db.session.query(
+        Individual.plot_id,
+        func.count(Individual.id).label('individual_count')
+    ).group_by(Individual.plot_id).subquery()
+
+def photo_counts_subquery():
+    """Per-plot photo counts, for joining instead of len(plot.photos)"""
+    return db.session.query(
+        Photo.plot_id,
+        func.count(Photo.id).label('photo_count')
+    ).group_by(Photo.plot_id).subquery()
+
+def preprocess_for_ocr(image_path):
+    """Load an image as grayscale, rescale it to the OCR target height and binarize it"""
+    # Every step is a single OpenCV call that runs natively with the GIL released, so
+    # ocr_executor threads already preprocess in parallel; keep per-pixel work out of Python
+    image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        raise ValueError(f"Could not read image {image_path}")
+    
+    height, width = image.shape
+    target_height = app.config['OCR_TARGET_HEIGHT']
+    if height != target_height:
+        scale = target_height / height
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_CUBIC
+        image = cv2.resize(image, (max(1, int(width * scale)), target_height), interpolation=interpolation)
+    
+    return cv2.adaptiveThreshold(image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10)
+
+def ocr_words_to_result(data, indices):
+    """Rebuild text line by line from image_to_data words, with their mean confidence (0-1)"""
+    lines = {}
+    confidences = []
+    for i in indices:
+        word = data['text'][i]
+        if not word.strip():
+            continue
+        key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        lines.setdefault(key, []).append(word)
+        confidence = float(data['conf'][i])
+        if confidence >= 0:
+            confidences.append(confidence)
+    
+    ocr_text = '\n'.join(' '.join(words) for words in lines.values())
+    ocr_confidence = sum(confidences) / len(confidences) / 100 if confidences else 0.0
+    return ocr_text, ocr_confidence
+
 def process_ocr(image_path):
-    """Process OCR on an image"""
+    """Process OCR on an image, returning the text and mean word confidence (0-1)"""
     try:
-        image = Image.open(image_path)
-        ocr_text = pytesseract.image_to_string(image, lang='eng')
-        return ocr_text.strip(), 0.8  # Placeholder confidence
+        image = preprocess_for_ocr(image_path)
+        data = pytesseract.image_to_data(image, lang='eng', config=OCR_CONFIG,
+                                         output_type=pytesseract.Output.DICT)
+        return ocr_words_to_result(data, range(len(data['text'])))
     except Exception as e:
         print(f"OCR Error: {str(e)}")
         return "", 0.0
 
+def process_ocr_batch(image_paths):
+    """Process OCR on several images, one Tesseract run per chunk of images"""
+    results = []
+    for start in range(0, len(image_paths), OCR_BATCH_SIZE):
+        results.extend(_process_ocr_chunk(image_paths[start:start + OCR_BATCH_SIZE]))
+    return results
+
+def _process_ocr_chunk(image_paths):
+    """Preprocess a chunk of images, run Tesseract once over their list file and split the words per page"""
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Same preprocessing as process_ocr, so batch and single results match
+            page_paths = []
+            for index, path in enumerate(image_paths):
+                page_path = os.path.join(temp_dir, f'{index}.png')
+                cv2.imwrite(page_path, preprocess_for_ocr(path))
+                page_paths.append(page_path)
+            
+            # Tesseract treats a .txt input as a list of images, one path per line
+            list_path = os.path.join(temp_dir, 'images.txt')
+            with open(list_path, 'w') as list_file:
+                list_file.write('\n'.join(page_paths))
+            
+            data = pytesseract.image_to_data(list_path, lang='eng', config=OCR_CONFIG,
+                                             output_type=pytesseract.Output.DICT)
+        
+        # page_num is 1-based and follows the order of the list file
+        pages = {}
+        for i, page_num in enumerate(data['page_num']):
+            pages.setdefault(int(page_num), []).append(i)
+        if len(pages) < len(image_paths):
+            raise ValueError(f"expected {len(image_paths)} pages, got {len(pages)}")
+        return [ocr_words_to_result(data, pages.get(page_num, []))
+                for page_num in range(1, len(image_paths) + 1)]
+    except Exception as e:
+        print(f"Batch OCR Error: {str(e)}")
+        return [process_ocr(path) for path in image_paths]
+
+def bulk_insert_plots(rows):
+    """Insert plot rows in one statement, skipping plot numbers already in the cemetery; returns the plot numbers inserted"""
+    if not rows:
+        return []
+    
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        db.session.bulk_insert_mappings(Plot, rows)
+        return [row['plot_number'] for row in rows]
+    
+    # Conflicting rows are skipped, so RETURNING only yields the plots that went in
+    stmt = (insert(Plot)
+            .on_conflict_do_nothing(index_elements=['cemetery_id', 'plot_number'])
+            .returning(Plot.plot_number))
+    return db.session.execute(stmt, rows).scalars().all()
+
+def split_imported_plots(plots, inserted_numbers):
+    """Split parsed plots into those bulk_insert_plots inserted and the plot numbers it skipped"""
+    remaining = set(inserted_numbers)
+    imported, skipped = [], []
+    for plot in plots:
+        # A plot number repeated within the file is only inserted once, for its first placemark
+        if plot['plot_number'] in remaining:
+            remaining.discard(plot['plot_number'])
+            imported.append(plot)
+        else:
+            skipped.append(plot['plot_number'])
+    return imported, skipped
+
+def import_message(imported, skipped, source=''):
+    """Summarize a plot import, mentioning plot numbers skipped as duplicates"""
+    message = f'Successfully imported {len(imported)} plots{source}'
+    if skipped:
+        message += f'; skipped {len(skipped)} duplicate plot numbers: {", ".join(skipped)}'
+    return message
+
+def conditional_json(state, build_payload):
+    """Return build_payload() as JSON with an ETag derived from state, or 304 if the client's copy is current"""
+    etag = hashlib.md5(repr(tuple(state)).encode()).hexdigest()
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify(build_payload())
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
+def page_args():
+    """Read ?page= and ?per_page= from the request, clamped to sane bounds"""
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', MAX_PAGE_SIZE, type=int), 1), MAX_PAGE_SIZE)
+    return page, per_page
+
+def add_pagination_headers(response, page, per_page, total):
+    """Advertise the total and the next page via X-Total-Count and a Link header"""
+    response.headers['X-Total-Count'] = str(total)
+    if page * per_page < total:
+        next_url = url_for(request.endpoint, **request.view_args,
+                           page=page + 1, per_page=per_page, _external=True)
+        response.headers['Link'] = f'<{next_url}>; rel="next"'
+    return response
+
+def run_ocr_job(photo_ids):
+    """Background job: OCR saved photos and store the results"""
+    with app.app_context():
+        photos = {p.id: p for p in Photo.query.filter(Photo.id.in_(photo_ids)).all()}
+        photos = [photos[photo_id] for photo_id in photo_ids if photo_id in photos]
+        if not photos:
+            return
+        
+        if len(photos) == 1:
+            ocr_results = [process_ocr(photos[0].file_path)]
+        else:
+            ocr_results = process_ocr_batch([photo.file_path for photo in photos])
+        
+        for photo, (ocr_text, ocr_confidence) in zip(photos, ocr_results):
+            photo.ocr_text = ocr_text
+            photo.ocr_confidence = ocr_confidence
+            photo.ocr_status = 'complete'
+        db.session.commit()
+
+def save_plot_photo(plot, file, photo_type):
+    """Save an uploaded photo to the plot's cemetery directory"""
+    filename = secure_filename(file.filename)
+    # Add timestamp to avoid conflicts
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f"{timestamp}_{filename}"
+    
+    # Save to cemetery-specific directory
+    cemetery_dir = os.path.join(app.config['UPLOAD_FOLDER'], 'cemeteries', secure_filename(plot.cemetery.name))
+    photo_dir = os.path.join(cemetery_dir, photo_type + 's')
+    ensure_dir(photo_dir)
+    
+    file_path = os.path.join(photo_dir, filename)
+    
+    # Read dimensions from the upload's header, then stream it to disk counting bytes
+    width, height = read_image_size(file.stream)
+    file_size = save_upload_stream(file.stream, file_path)
+    
+    return {
+        'filename': filename,
+        'file_path': file_path,
+        'file_size': file_size,
+        'width': width,
+        'height': height
+    }
+
+def read_image_size(stream):
+    """Read image dimensions from the header of an image stream without decoding pixels"""
+    try:
+        # Image.open only parses the header (first IFD for TIFF); pixels load on first access,
+        # which never happens here. Limiting formats skips probing every other PIL plugin.
+        with Image.open(stream, formats=PHOTO_FORMATS) as img:
+            return img.size
+    except Exception:
+        return 0, 0
+    finally:
+        stream.seek(0)
+
+def save_upload_stream(stream, file_path):
+    """Copy an upload stream to disk in chunks, returning the number of bytes written"""
+    file_size = 0
+    with open(file_path, 'wb') as out:
+        while True:
+            chunk = stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            out.write(chunk)
+            file_size += len(chunk)
+    return file_size
+
+def create_photo_record(plot_id, photo_type, saved_file):
+    """Add a Photo row for a file saved by save_plot_photo to the session"""
+    photo = Photo(
+        plot_id=plot_id,
+        photo_type=photo_type,
+        ocr_text="",
+        ocr_confidence=0.0,
+        ocr_status='pending' if photo_type == 'headstone' else None,
+        **saved_file
+    )
+    db.session.add(photo)
+    return photo
+
+def photo_to_dict(photo):
+    """Serialize photo metadata for API responses"""
+    return {
+        'id': photo.id,
+        'filename': photo.filename,
+        'photo_type': photo.photo_type,
+        'ocr_text': photo.ocr_text,
+        'ocr_confidence': photo.ocr_confidence,
+        'ocr_status': photo.ocr_status,
+        'file_size': photo.file_size,
+        'width': photo.width,
+        'height': photo.height,
+        'created_at': photo.created_at.isoformat()
+    }
+
+def plot_from_json(cemetery_id, data):
+    """Build a Plot from request JSON, raising ValueError with a client-facing message if invalid"""
+    if not data or not data.get('plot_number'):
+        raise ValueError('Plot number is required')
+    
+    return Plot(
+        cemetery_id=cemetery_id,
+        plot_number=data['plot_number'],
+        section=data.get('section', ''),
+        row=data.get('row', ''),
+        latitude=data.get('latitude'),
+        longitude=data.get('longitude'),
+        status=data.get('status', 'active')
+    )
+
+def individual_from_json(plot_id, data):
+    """Build an Individual from request JSON, raising ValueError with a client-facing message if invalid"""
+    if not data or not data.get('name'):
+        raise ValueError('Individual name is required')
+    
+    try:
+        born_date = date.fromisoformat(data['born_date']) if data.get('born_date') else None
+        died_date = date.fromisoformat(data['died_date']) if data.get('died_date') else None
+    except (TypeError, ValueError):
+        raise ValueError('Dates must be in YYYY-MM-DD format')
+    
+    return Individual(
+        plot_id=plot_id,
+        name=data['name'],
+        born_date=born_date,
+        died_date=died_date,
+        epitaph=data.get('epitaph', ''),
+        relationship=data.get('relationship', '')
+    )
+
+def individual_to_dict(individual):
+    """Serialize an individual for API responses"""
+    return {
+        'id': individual.id,
+        'name': individual.name,
+        'born_date': individual.born_date.isoformat() if individual.born_date else None,
+        'died_date': individual.died_date.isoformat() if individual.died_date else None,
+        'epitaph': individual.epitaph,
+        'relationship': individual.relationship
+    }
+
 def extract_kmz_data(kmz_path):
     """Extract data from KMZ file"""
     try:
@@ -161,33 +589,47 @@ def extract_kmz_data(kmz_path):
             # Look for KML files in the KMZ
             kml_files = [f for f in kmz.namelist() if f.endswith('.kml')]
             if kml_files:
-                kml_content = kmz.read(kml_files[0])
-                return parse_kml_data(kml_content)
+                # Parse straight from the archive member instead of reading it all into memory
+                with kmz.open(kml_files[0]) as kml_file:
+                    return parse_kml_data(kml_file)
     except Exception as e:
         print(f"KMZ extraction error: {str(e)}")
     return []
 
 def parse_kml_data(kml_content):
-    """Parse KML data to extract coordinates and names"""
+    """Parse KML data (bytes or a file-like object) to extract coordinates and names"""
     try:
-        root = ET.fromstring(kml_content)
-        places = []
+        source = BytesIO(kml_content) if isinstance(kml_content, bytes) else kml_content
+        names = []
+        longitudes = []
+        latitudes = []
         
-        # Find all Placemark elements
-        for placemark in root.findall('.//{http://www.opengis.net/kml/2.2}Placemark'):
-            name_elem = placemark.find('.//{http://www.opengis.net/kml/2.2}name')
-            coord_elem = placemark.find('.//{http://www.opengis.net/kml/2.2}coordinates')
+        # Stream Placemark elements rather than building the whole document tree
+        for _, placemark in etree.iterparse(source, tag=KML_NS + 'Placemark'):
+            name = placemark.findtext('.//' + KML_NS + 'name')
+            coord_text = placemark.findtext('.//' + KML_NS + 'coordinates')
             
-            if name_elem is not None and coord_elem is not None:
-                name = name_elem.text
-                coords = coord_elem.text.strip().split(',')
+            if name is not None and coord_text is not None:
+                coords = coord_text.strip().split(',')
                 if len(coords) >= 2:
-                    places.append({
-                        'name': name,
-                        'longitude': float(coords[0]),
-                        'latitude': float(coords[1])
-                    })
-        return places
+                    names.append(name)
+                    longitudes.append(coords[0])
+                    latitudes.append(coords[1])
+            
+            # Drop the placemark and any already-parsed siblings so the tree never grows
+            placemark.clear()
+            while placemark.getprevious() is not None:
+                del placemark.getparent()[0]
+        
+        # Convert all coordinate strings in one pass instead of float() per placemark
+        longitudes = np.array(longitudes, dtype=np.float64).tolist()
+        latitudes = np.array(latitudes, dtype=np.float64).tolist()
+        
+        return [{
+            'name': name,
+            'longitude': longitude,
+            'latitude': latitude
+        } for name, longitude, latitude in zip(names, longitudes, latitudes)]
     except Exception as e:
         print(f"KML parsing error: {str(e)}")
     return []
@@ -201,16 +643,44 @@ def health_check():
 
 @app.route('/api/cemeteries', methods=['GET'])
 def get_cemeteries():
-    """Get all cemeteries"""
-    cemeteries = Cemetery.query.all()
-    return jsonify([{
-        'id': c.id,
-        'name': c.name,
-        'location': c.location,
-        'description': c.description,
-        'plot_count': len(c.plots),
-        'created_at': c.created_at.isoformat()
-    } for c in cemeteries])
+    """Get one page of cemeteries, optionally only the one matching ?name="""
+    page, per_page = page_args()
+    name = request.args.get('name')
+    # Exact name lookups use the unique index on name instead of clients scanning the list
+    filters = [Cemetery.name == name] if name is not None else []
+    
+    # Row counts and last update times change whenever the listing would
+    state = db.session.query(
+        db.session.query(func.count(Cemetery.id)).filter(*filters).scalar_subquery(),
+        db.session.query(func.max(Cemetery.updated_at)).filter(*filters).scalar_subquery(),
+        db.session.query(func.count(Plot.id)).scalar_subquery(),
+        db.session.query(func.max(Plot.updated_at)).scalar_subquery()
+    ).one()
+    
+    def build_payload():
+        # Count plots in the same query instead of lazy-loading c.plots per row;
+        # plain column tuples avoid building ORM objects for the listing
+        rows = db.session.query(
+            Cemetery.id,
+            Cemetery.name,
+            Cemetery.location,
+            Cemetery.description,
+            Cemetery.created_at,
+            func.count(Plot.id).label('plot_count')
+        ).outerjoin(Plot, Plot.cemetery_id == Cemetery.id).filter(*filters).group_by(Cemetery.id
+        ).order_by(Cemetery.id).limit(per_page).offset((page - 1) * per_page).all()
+        
+        return [{
+            'id': row.id,
+            'name': row.name,
+            'location': row.location,
+            'description': row.description,
+            'plot_count': row.plot_count,
+            'created_at': row.created_at.isoformat()
+        } for row in rows]
+    
+    response = conditional_json((*state, name, page, per_page), build_payload)
+    return add_pagination_headers(response, page, per_page, state[0])
 
 @app.route('/api/cemeteries', methods=['POST'])
 def create_cemetery():
@@ -220,26 +690,24 @@ def create_cemetery():
     if not data or not data.get('name'):
         return jsonify({'error': 'Cemetery name is required'}), 400
     
-    # Check if cemetery already exists
-    existing = Cemetery.query.filter_by(name=data['name']).first()
-    if existing:
-        return jsonify({'error': 'Cemetery with this name already exists'}), 400
-    
     cemetery = Cemetery(
         name=data['name'],
         location=data.get('location', ''),
         description=data.get('description', '')
     )
     
+    # The unique constraint on name rejects duplicates; no separate lookup needed
     db.session.add(cemetery)
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({'error': 'Cemetery with this name already exists'}), 400
     
     # Create cemetery directory
     cemetery_dir = os.path.join(app.config['UPLOAD_FOLDER'], 'cemeteries', secure_filename(data['name']))
-    os.makedirs(cemetery_dir, exist_ok=True)
-    os.makedirs(os.path.join(cemetery_dir, 'blueprints'), exist_ok=True)
-    os.makedirs(os.path.join(cemetery_dir, 'headstones'), exist_ok=True)
-    os.makedirs(os.path.join(cemetery_dir, '360_photos'), exist_ok=True)
+    for subdir in ('blueprints', 'headstones', '360_photos'):
+        ensure_dir(os.path.join(cemetery_dir, subdir))
     
     return jsonify({
         'id': cemetery.id,
@@ -268,48 +736,61 @@ def delete_cemetery(cemetery_id):
 
 @app.route('/api/cemeteries/<int:cemetery_id>/plots', methods=['GET'])
 def get_plots(cemetery_id):
-    """Get all plots for a cemetery"""
+    """Get one page of plots for a cemetery"""
     cemetery = Cemetery.query.get_or_404(cemetery_id)
-    plots = Plot.query.filter_by(cemetery_id=cemetery_id).all()
+    page, per_page = page_args()
+    
+    # Plots, and the individuals/photos counted per plot, determine the listing
+    plot_ids = db.session.query(Plot.id).filter(Plot.cemetery_id == cemetery_id)
+    state = db.session.query(
+        plot_ids.with_entities(func.count(Plot.id)).scalar_subquery(),
+        plot_ids.with_entities(func.max(Plot.updated_at)).scalar_subquery(),
+        db.session.query(func.count(Individual.id)).filter(Individual.plot_id.in_(plot_ids)).scalar_subquery(),
+        db.session.query(func.max(Individual.id)).filter(Individual.plot_id.in_(plot_ids)).scalar_subquery(),
+        db.session.query(func.count(Photo.id)).filter(Photo.plot_id.in_(plot_ids)).scalar_subquery(),
+        db.session.query(func.max(Photo.id)).filter(Photo.plot_id.in_(plot_ids)).scalar_subquery()
+    ).one()
+    
+    def build_payload():
+        individual_counts = individual_counts_subquery()
+        photo_counts = photo_counts_subquery()
+        rows = db.session.query(
+            Plot.id,
+            Plot.plot_number,
+            Plot.section,
+            Plot.row,
+            Plot.latitude,
+            Plot.longitude,
+            Plot.status,
+            func.coalesce(individual_counts.c.individual_count, 0).label('individual_count'),
+            func.coalesce(photo_counts.c.photo_count, 0).label('photo_count')
+        ).outerjoin(individual_counts, individual_counts.c.plot_id == Plot.id
+        ).outerjoin(photo_counts, photo_counts.c.plot_id == Plot.id
+        ).filter(Plot.cemetery_id == cemetery_id
+        ).order_by(Plot.id).limit(per_page).offset((page - 1) * per_page).all()
+        
+        return [dict(row._mapping) for row in rows]
     
-    return jsonify([{
-        'id': p.id,
-        'plot_number': p.plot_number,
-        'section': p.section,
-        'row': p.row,
-        'latitude': p.latitude,
-        'longitude': p.longitude,
-        'status': p.status,
-        'individual_count': len(p.individuals),
-        'photo_count': len(p.photos)
-    } for p in plots])
+    response = conditional_json((*state, page, per_page), build_payload)
+    return add_pagination_headers(response, page, per_page, state[0])
 
 @app.route('/api/cemeteries/<int:cemetery_id>/plots', methods=['POST'])
 def create_plot(cemetery_id):
     """Create a new plot"""
     cemetery = Cemetery.query.get_or_404(cemetery_id)
-    data = request.get_json()
-    
-    if not data or not data.get('plot_number'):
-        return jsonify({'error': 'Plot number is required'}), 400
     
-    # Check if plot already exists in this cemetery
-    existing = Plot.query.filter_by(cemetery_id=cemetery_id, plot_number=data['plot_number']).first()
-    if existing:
-        return jsonify({'error': 'Plot with this number already exists in this cemetery'}), 400
-    
-    plot = Plot(
-        cemetery_id=cemetery_id,
-        plot_number=data['plot_number'],
-        section=data.get('section', ''),
-        row=data.get('row', ''),
-        latitude=data.get('latitude'),
-        longitude=data.get('longitude'),
-        status=data.get('status', 'active')
-    )
+    try:
+        plot = plot_from_json(cemetery_id, request.get_json())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
+    # unique_plot_per_cemetery rejects duplicate plot numbers
     db.session.add(plot)
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({'error': 'Plot with this number already exists in this cemetery'}), 400
     
     return jsonify({
         'id': plot.id,
@@ -321,35 +802,101 @@ def create_plot(cemetery_id):
         'status': plot.status
     }), 201
 
+@app.route('/api/cemeteries/<int:cemetery_id>/bulk-import', methods=['POST'])
+def bulk_import(cemetery_id):
+    """Create many plots, each with an optional individual, in one request
+    
+    Items that can't be imported are skipped and reported by index in 'errors'.
+    """
+    cemetery = Cemetery.query.get_or_404(cemetery_id)
+    data = request.get_json()
+    
+    if not data or not data.get('items'):
+        return jsonify({'error': 'No items provided'}), 400
+    
+    items = data['items']
+    plot_numbers = [(item.get('plot') or {}).get('plot_number') for item in items]
+    
+    # Existing plot numbers are looked up once for the whole batch
+    taken = {number for (number,) in db.session.query(Plot.plot_number).filter(
+        Plot.cemetery_id == cemetery_id,
+        Plot.plot_number.in_([number for number in plot_numbers if number])
+    )}
+    
+    errors = []
+    plots = []
+    pending_individuals = []
+    for index, (item, plot_number) in enumerate(zip(items, plot_numbers)):
+        if plot_number in taken:
+            errors.append({'index': index, 'error': 'Plot with this number already exists in this cemetery'})
+            continue
+        
+        try:
+            plot = plot_from_json(cemetery_id, item.get('plot'))
+        except ValueError as e:
+            errors.append({'index': index, 'error': str(e)})
+            continue
+        
+        taken.add(plot_number)
+        plots.append(plot)
+        if item.get('individual'):
+            pending_individuals.append((index, plot, item['individual']))
+    
+    # Flush to give the new plots their ids before their individuals are built
+    db.session.add_all(plots)
+    db.session.flush()
+    
+    individuals = []
+    for index, plot, individual_data in pending_individuals:
+        try:
+            individuals.append(individual_from_json(plot.id, individual_data))
+        except ValueError as e:
+            errors.append({'index': index, 'error': str(e)})
+    
+    db.session.add_all(individuals)
+    db.session.commit()
+    
+    return jsonify({
+        'success': True,
+        'message': f'Imported {len(plots)} plots and {len(individuals)} individuals',
+        'plots_created': len(plots),
+        'individuals_created': len(individuals),
+        'errors': sorted(errors, key=lambda error: error['index'])
+    }), 201
+
 @app.route('/api/plots/<int:plot_id>/individuals', methods=['POST'])
 def add_individual(plot_id):
     """Add an individual to a plot"""
     plot = Plot.query.get_or_404(plot_id)
+    
+    try:
+        individual = individual_from_json(plot_id, request.get_json())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    db.session.add(individual)
+    db.session.commit()
+    
+    return jsonify(individual_to_dict(individual)), 201
+
+@app.route('/api/plots/<int:plot_id>/individuals/bulk', methods=['POST'])
+def add_individuals_bulk(plot_id):
+    """Add several individuals to a plot in one request"""
+    plot = Plot.query.get_or_404(plot_id)
     data = request.get_json()
     
-    if not data or not data.get('name'):
-        return jsonify({'error': 'Individual name is required'}), 400
+    if not data or not data.get('individuals'):
+        return jsonify({'error': 'No individuals provided'}), 400
     
-    individual = Individual(
-        plot_id=plot_id,
-        name=data['name'],
-        born_date=datetime.strptime(data['born_date'], '%Y-%m-%d').date() if data.get('born_date') else None,
-        died_date=datetime.strptime(data['died_date'], '%Y-%m-%d').date() if data.get('died_date') else None,
-        epitaph=data.get('epitaph', ''),
-        relationship=data.get('relationship', '')
-    )
+    try:
+        individuals = [individual_from_json(plot_id, entry) for entry in data['individuals']]
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
-    db.session.add(individual)
+    db.session.add_all(individuals)
     db.session.commit()
     
-    return jsonify({
-        'id': individual.id,
-        'name': individual.name,
-        'born_date': individual.born_date.isoformat() if individual.born_date else None,
-        'died_date': individual.died_date.isoformat() if individual.died_date else None,
-        'epitaph': individual.epitaph,
-        'relationship': individual.relationship
-    }), 201
+    return jsonify([individual_to_dict(individual) for individual in individuals]), 201
 
 @app.route('/api/plots/<int:plot_id>/photos', methods=['POST'])
 def upload_photo(plot_id):
@@ -366,63 +913,56 @@ def upload_photo(plot_id):
     # Get photo type from form data
     photo_type = request.form.get('photo_type', 'headstone')
     
-    if file and allowed_file(file.filename, {'jpg', 'jpeg', 'png', 'bmp', 'tiff', 'tif'}):
-        filename = secure_filename(file.filename)
-        # Add timestamp to avoid conflicts
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{timestamp}_{filename}"
-        
-        # Save to cemetery-specific directory
-        cemetery_dir = os.path.join(app.config['UPLOAD_FOLDER'], 'cemeteries', secure_filename(plot.cemetery.name))
-        photo_dir = os.path.join(cemetery_dir, photo_type + 's')
-        os.makedirs(photo_dir, exist_ok=True)
-        
-        file_path = os.path.join(photo_dir, filename)
-        file.save(file_path)
+    if file and allowed_file(file.filename, PHOTO_EXTENSIONS) and is_image_file(file):
+        photo = create_photo_record(plot_id, photo_type, save_plot_photo(plot, file, photo_type))
+        db.session.commit()
         
-        # Process OCR if it's a headstone photo
-        ocr_text = ""
-        ocr_confidence = 0.0
+        # Process OCR in the background if it's a headstone photo
         if photo_type == 'headstone':
-            ocr_text, ocr_confidence = process_ocr(file_path)
-        
-        # Get image dimensions
-        try:
-            with Image.open(file_path) as img:
-                width, height = img.size
-        except:
-            width, height = 0, 0
-        
-        # Save photo metadata to database
-        photo = Photo(
-            plot_id=plot_id,
-            filename=filename,
-            file_path=file_path,
-            photo_type=photo_type,
-            ocr_text=ocr_text,
-            ocr_confidence=ocr_confidence,
-            file_size=os.path.getsize(file_path),
-            width=width,
-            height=height
-        )
+            ocr_executor.submit(run_ocr_job, [photo.id])
+            return jsonify(photo_to_dict(photo)), 202
         
-        db.session.add(photo)
-        db.session.commit()
-        
-        return jsonify({
-            'id': photo.id,
-            'filename': photo.filename,
-            'photo_type': photo.photo_type,
-            'ocr_text': photo.ocr_text,
-            'ocr_confidence': photo.ocr_confidence,
-            'file_size': photo.file_size,
-            'width': photo.width,
-            'height': photo.height,
-            'created_at': photo.created_at.isoformat()
-        }), 201
+        return jsonify(photo_to_dict(photo)), 201
     
     return jsonify({'error': 'Invalid file type'}), 400
 
+@app.route('/api/plots/<int:plot_id>/photos/bulk', methods=['POST'])
+def upload_photos_bulk(plot_id):
+    """Upload several photos for a plot, running OCR on them in one Tesseract call"""
+    plot = Plot.query.get_or_404(plot_id)
+    
+    files = [f for f in request.files.getlist('files') if f.filename]
+    if not files:
+        return jsonify({'error': 'No files provided'}), 400
+    
+    if not all(allowed_file(f.filename, PHOTO_EXTENSIONS) and is_image_file(f) for f in files):
+        return jsonify({'error': 'Invalid file type'}), 400
+    
+    photo_type = request.form.get('photo_type', 'headstone')
+    photos = [
+        create_photo_record(plot_id, photo_type, save_plot_photo(plot, f, photo_type))
+        for f in files
+    ]
+    db.session.commit()
+    
+    # Process OCR for all headstone photos in one background job
+    if photo_type == 'headstone':
+        ocr_executor.submit(run_ocr_job, [photo.id for photo in photos])
+        return jsonify([photo_to_dict(photo) for photo in photos]), 202
+    
+    return jsonify([photo_to_dict(photo) for photo in photos]), 201
+
+@app.route('/api/photos/<int:photo_id>/ocr', methods=['GET'])
+def get_photo_ocr(photo_id):
+    """Get the OCR status and result for a photo"""
+    photo = Photo.query.get_or_404(photo_id)
+    return jsonify({
+        'id': photo.id,
+        'ocr_status': photo.ocr_status,
+        'ocr_text': photo.ocr_text,
+        'ocr_confidence': photo.ocr_confidence
+    })
+
 @app.route('/api/cemeteries/<int:cemetery_id>/blueprints', methods=['POST'])
 def upload_blueprint(cemetery_id):
     """Upload a blueprint for a cemetery"""
@@ -442,7 +982,7 @@ def upload_blueprint(cemetery_id):
         
         # Save to blueprints directory
         blueprint_dir = os.path.join(app.config['UPLOAD_FOLDER'], 'cemeteries', secure_filename(cemetery.name), 'blueprints')
-        os.makedirs(blueprint_dir, exist_ok=True)
+        ensure_dir(blueprint_dir)
         
         file_path = os.path.join(blueprint_dir, filename)
         file.save(file_path)
@@ -488,42 +1028,38 @@ def import_kmz(cemetery_id):
         
         # Save file temporarily
         temp_dir = os.path.join(app.config['UPLOAD_FOLDER'], 'temp')
-        os.makedirs(temp_dir, exist_ok=True)
+        ensure_dir(temp_dir)
         temp_path = os.path.join(temp_dir, filename)
         file.save(temp_path)
         
-        # Extract data
-        places = []
-        if filename.endswith('.kmz'):
-            places = extract_kmz_data(temp_path)
-        elif filename.endswith('.kml'):
-            with open(temp_path, 'rb') as f:
-                places = parse_kml_data(f.read())
-        
-        # Create plots from extracted data
-        created_plots = []
-        for place in places:
-            plot = Plot(
-                cemetery_id=cemetery_id,
-                plot_number=place['name'],
-                latitude=place['latitude'],
-                longitude=place['longitude']
-            )
-            db.session.add(plot)
-            created_plots.append({
+        try:
+            # Extract data
+            places = []
+            if filename.endswith('.kmz'):
+                places = extract_kmz_data(temp_path)
+            elif filename.endswith('.kml'):
+                with open(temp_path, 'rb') as f:
+                    places = parse_kml_data(f)
+            
+            # Create plots from extracted data
+            created_plots = [{
                 'plot_number': place['name'],
                 'latitude': place['latitude'],
                 'longitude': place['longitude']
-            })
-        
-        db.session.commit()
+            } for place in places]
+            
+            inserted = bulk_insert_plots([dict(plot, cemetery_id=cemetery_id) for plot in created_plots])
+            db.session.commit()
+        finally:
+            # Clean up temp file
+            os.remove(temp_path)
         
-        # Clean up temp file
-        os.remove(temp_path)
+        created_plots, skipped = split_imported_plots(created_plots, inserted)
         
         return jsonify({
-            'message': f'Successfully imported {len(created_plots)} plots',
-            'plots': created_plots
+            'message': import_message(created_plots, skipped),
+            'plots': created_plots,
+            'skipped': skipped
         }), 201
     
     return jsonify({'error': 'Invalid file type'}), 400
@@ -535,20 +1071,35 @@ def search():
     if not query:
         return jsonify({'error': 'Search query is required'}), 400
     
-    # Search individuals
-    individuals = Individual.query.filter(
-        Individual.name.ilike(f'%{query}%')
-    ).all()
+    # Search individuals (eager-load plot and cemetery to avoid per-row lookups)
+    if len(query) >= FTS_MIN_QUERY_LENGTH and individual_fts_available():
+        fts_query = '"' + query.replace('"', '""') + '"'
+        name_filter = Individual.id.in_(
+            text("SELECT rowid FROM individual_fts WHERE individual_fts MATCH :q").bindparams(q=fts_query)
+        )
+    else:
+        name_filter = Individual.name.ilike(f'%{query}%')
+    individuals = Individual.query.options(
+        joinedload(Individual.plot).joinedload(Plot.cemetery)
+    ).filter(name_filter).all()
     
     # Search plots
-    plots = Plot.query.filter(
+    individual_counts = individual_counts_subquery()
+    plots = db.session.query(
+        Plot,
+        func.coalesce(individual_counts.c.individual_count, 0)
+    ).outerjoin(individual_counts, individual_counts.c.plot_id == Plot.id
+    ).options(joinedload(Plot.cemetery)).filter(
         Plot.plot_number.ilike(f'%{query}%')
     ).all()
     
     # Search cemeteries
-    cemeteries = Cemetery.query.filter(
+    cemeteries = db.session.query(
+        Cemetery,
+        func.count(Plot.id)
+    ).outerjoin(Plot, Plot.cemetery_id == Cemetery.id).filter(
         Cemetery.name.ilike(f'%{query}%')
-    ).all()
+    ).group_by(Cemetery.id).all()
     
     return jsonify({
         'individuals': [{
@@ -565,16 +1116,34 @@ def search():
             'section': p.section,
             'row': p.row,
             'cemetery_name': p.cemetery.name,
-            'individual_count': len(p.individuals)
-        } for p in plots],
+            'individual_count': individual_count
+        } for p, individual_count in plots],
         'cemeteries': [{
             'id': c.id,
             'name': c.name,
             'location': c.location,
-            'plot_count': len(c.plots)
-        } for c in cemeteries]
+            'plot_count': plot_count
+        } for c, plot_count in cemeteries]
     })
 
+@app.route('/uploads/<path:filename>', methods=['GET'])
+def serve_upload(filename):
+    """Serve an uploaded photo or blueprint"""
+    upload_folder = os.path.abspath(app.config['UPLOAD_FOLDER'])
+    prefix = app.config['X_ACCEL_REDIRECT_PREFIX']
+    
+    if prefix:
+        # Let nginx send the file itself; the worker only returns headers
+        file_path = safe_join(upload_folder, filename)
+        if file_path is None or not os.path.isfile(file_path):
+            return jsonify({'error': 'Resource not found'}), 404
+        response = Response(mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+        response.headers['X-Accel-Redirect'] = f"{prefix.rstrip('/')}/{filename}"
+        return response
+    
+    # send_from_directory hands the file to the server's wsgi.file_wrapper (sendfile where supported)
+    return send_from_directory(upload_folder, filename)
+
 @app.route('/api/cemeteries/<int:cemetery_id>/setup-location', methods=['POST'])
 def setup_cemetery_location(cemetery_id):
     """Set up cemetery location using GPS coordinates"""
@@ -634,40 +1203,39 @@ def import_google_earth_data(cemetery_id):
         
         # Save file temporarily
         temp_dir = os.path.join(app.config['UPLOAD_FOLDER'], 'temp')
-        os.makedirs(temp_dir, exist_ok=True)
+        ensure_dir(temp_dir)
         temp_path = os.path.join(temp_dir, filename)
         file.save(temp_path)
         
-        # Import data from Google Earth
-        plots_data = map_manager.import_google_earth_data(temp_path)
-        
-        # Create plots in database
-        created_plots = []
-        for plot_data in plots_data:
-            plot = Plot(
-                cemetery_id=cemetery_id,
-                plot_number=plot_data['plot_number'],
-                latitude=plot_data['latitude'],
-                longitude=plot_data['longitude'],
-                section=plot_data.get('section', ''),
-                row=plot_data.get('row', '')
-            )
-            db.session.add(plot)
-            created_plots.append({
-                'plot_number': plot_data['plot_number'],
-                'latitude': plot_data['latitude'],
-                'longitude': plot_data['longitude']
-            })
-        
-        db.session.commit()
+        try:
+            # Import data from Google Earth
+            plots_table = map_manager.import_google_earth_data(temp_path)
+            
+            # Walk the parsed columns directly rather than materializing a dict per plot first
+            created_plots = [{
+                'plot_number': plot_number,
+                'latitude': latitude,
+                'longitude': longitude
+            } for plot_number, latitude, longitude in zip(
+                plots_table.plot_number, plots_table.latitude.tolist(), plots_table.longitude.tolist())]
+            
+            # Create plots in database
+            inserted = bulk_insert_plots([
+                dict(plot, cemetery_id=cemetery_id, section='', row='')
+                for plot in created_plots
+            ])
+            db.session.commit()
+        finally:
+            # Clean up temp file
+            os.remove(temp_path)
         
-        # Clean up temp file
-        os.remove(temp_path)
+        created_plots, skipped = split_imported_plots(created_plots, inserted)
         
         return jsonify({
             'success': True,
-            'message': f'Successfully imported {len(created_plots)} plots from Google Earth',
-            'plots': created_plots
+            'message': import_message(created_plots, skipped, ' from Google Earth'),
+            'plots': created_plots,
+            'skipped': skipped
         })
     
     return jsonify({'error': 'Invalid file type. Please upload a KMZ or KML file.'}), 400
@@ -806,4 +1374,5 @@ def internal_error(error):
 if __name__ == '__main__':
     with app.app_context():
         db.create_all()
+        setup_search_indexes()
     app.run(debug=True, host='0.0.0.0', port=5000)
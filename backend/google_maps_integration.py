@@ -6,43 +6,222 @@ Dependencies:
 - googlemaps (Google Maps API client)
 - folium (for interactive maps)
 - requests
+- lxml
+- numpy
 
 Author: Project Elysian Fields Development Team
 """
 
 import os
 import json
+import time
+import threading
 import requests
-from typing import List, Dict, Tuple, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Tuple, Optional, NamedTuple
+import zipfile
+from io import BytesIO
+import numpy as np
+from lxml import etree
 import folium
 from folium import plugins
 import webbrowser
 from pathlib import Path
 
+# Generated maps and the geocode cache live in <project>/maps, independent of the working directory
+MAPS_DIR = Path(__file__).resolve().parent.parent / "maps"
+_maps_dir_ready = False
+
+def ensure_maps_dir() -> Path:
+    """Create MAPS_DIR once per process and return it"""
+    global _maps_dir_ready
+    if not _maps_dir_ready:
+        MAPS_DIR.mkdir(exist_ok=True)
+        _maps_dir_ready = True
+    return MAPS_DIR
+
+KML_NS = '{http://www.opengis.net/kml/2.2}'
+_TAG_PLACEMARK = KML_NS + 'Placemark'
+_TAG_NAME = KML_NS + 'name'
+_TAG_DESC = KML_NS + 'description'
+# Coordinates sit under Point/LineString/Polygon, so this one stays a descendant search (compiled once)
+_COORDS_XPATH = etree.XPath('.//kml:coordinates/text()', namespaces={'kml': KML_NS.strip('{}')})
+
+# Nominatim allows at most one request per second per client
+NOMINATIM_MIN_INTERVAL = 1.0
+
+# Nominatim retries go through the rate limit above, so they are not left to urllib3
+NOMINATIM_HOST = 'https://nominatim.openstreetmap.org/'
+NOMINATIM_RETRIES = 3
+
+# Longer Retry-After values are capped to this many seconds between Nominatim attempts
+NOMINATIM_MAX_RETRY_AFTER = 30
+
+# Transient HTTP statuses worth retrying
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Nominatim returns a handful of results; anything bigger is not a valid answer
+MAX_GEOCODE_RESPONSE_BYTES = 1024 * 1024
+
+# Number of geocoded addresses kept (in memory and in maps/geocode_cache.json)
+GEOCODE_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=8192)
+def _render_plot_popup(plot_number, section, individuals: Tuple) -> str:
+    """Popup HTML for a plot; individuals is a tuple of (name, born_date, died_date)"""
+    parts = [f"<b>Plot {plot_number}</b><br>"]
+    if section:
+        parts.append(f"Section: {section}<br>")
+    if individuals:
+        parts.append("<br><b>Individuals:</b><br>")
+        parts.extend(
+            f"• {name}<br>"
+            + (f"  Born: {born_date}<br>" if born_date else '')
+            + (f"  Died: {died_date}<br>" if died_date else '')
+            for name, born_date, died_date in individuals
+        )
+    # Join once instead of growing the string fragment by fragment
+    return ''.join(parts)
+
+class PlotTable(NamedTuple):
+    """Plots parsed from KML, stored column-wise rather than one dict per plot"""
+    plot_number: List[str]
+    latitude: np.ndarray
+    longitude: np.ndarray
+    description: List[str]
+    
+    @property
+    def size(self) -> int:
+        return len(self.plot_number)
+    
+    @classmethod
+    def empty(cls) -> 'PlotTable':
+        return cls([], np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64), [])
+    
+    @classmethod
+    def concat(cls, tables: List['PlotTable']) -> 'PlotTable':
+        """Join tables, e.g. one per KML layer in a KMZ"""
+        if not tables:
+            return cls.empty()
+        return cls(
+            [number for table in tables for number in table.plot_number],
+            np.concatenate([table.latitude for table in tables]),
+            np.concatenate([table.longitude for table in tables]),
+            [description for table in tables for description in table.description]
+        )
+    
+    def to_dicts(self) -> List[Dict]:
+        """The plots as a list of dicts, for callers that want the row-wise shape"""
+        return [{
+            'plot_number': plot_number,
+            'latitude': latitude,
+            'longitude': longitude,
+            'description': description
+        } for plot_number, latitude, longitude, description in zip(
+            self.plot_number, self.latitude.tolist(), self.longitude.tolist(), self.description)]
+
+def create_http_session() -> requests.Session:
+    """Session with a keep-alive connection pool and retries for transient errors"""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=RETRY_STATUSES,
+                    allowed_methods=frozenset(['GET']))
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 class GoogleMapsIntegration:
     """Google Maps integration for cemetery management"""
     
+    NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+    NOMINATIM_PARAMS = {'format': 'json', 'limit': 1, 'addressdetails': 1}
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv('GOOGLE_MAPS_API_KEY')
         self.base_url = "https://maps.googleapis.com/maps/api"
-        # Use absolute path for maps directory
-        self.maps_dir = Path(__file__).parent.parent / "maps"
-        self.maps_dir.mkdir(exist_ok=True)
+        # Fixed parts of each geocode request, built once; only the address changes per call
+        self._geocode_url = f"{self.base_url}/geocode/json"
+        self._geocode_params = {'key': self.api_key}
+        # One session per instance so geocoding reuses TCP/TLS connections
+        self.session = create_http_session()
+        # Nominatim's usage policy requires an identifying User-Agent
+        self.session.headers.update({'User-Agent': 'ElysianFields/1.0 (Cemetery Management System)'})
+        # urllib3 retries would bypass the Nominatim rate limit; _nominatim_get retries instead
+        self.session.mount(NOMINATIM_HOST, HTTPAdapter(pool_maxsize=10, max_retries=0))
+        self.maps_dir = ensure_maps_dir()
+        # Geocoded addresses persist across runs; Nominatim's usage policy asks clients to cache
+        self._cache_path = self.maps_dir / "geocode_cache.json"
+        self._geocode_cache = self._load_geocode_cache()
+        self._cache_lock = threading.Lock()
+        self._nominatim_lock = threading.Lock()
+        self._last_nominatim_request = 0.0
+    
+    def _load_geocode_cache(self) -> OrderedDict:
+        """Load previously geocoded addresses from disk"""
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as f:
+                return OrderedDict(json.load(f))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Geocode cache load error: {e}")
+        return OrderedDict()
+    
+    def _save_geocode_cache(self):
+        """Write the geocode cache atomically so a crash never leaves a truncated file"""
+        try:
+            tmp_path = self._cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._geocode_cache, f)
+            tmp_path.replace(self._cache_path)
+        except OSError as e:
+            print(f"Geocode cache save error: {e}")
         
     def geocode_address(self, address: str) -> Optional[Dict]:
-        """Get GPS coordinates for an address"""
+        """Get GPS coordinates for an address, reusing earlier lookups"""
+        key = self._cache_key(address)
+        with self._cache_lock:
+            if key in self._geocode_cache:
+                self._geocode_cache.move_to_end(key)
+                return dict(self._geocode_cache[key])
+        
+        result = self._geocode_uncached(address)
+        # Only successful lookups are cached so a network failure can be retried
+        if result:
+            with self._cache_lock:
+                self._geocode_cache[key] = result
+                if len(self._geocode_cache) > GEOCODE_CACHE_SIZE:
+                    self._geocode_cache.popitem(last=False)
+                self._save_geocode_cache()
+            return dict(result)
+        return None
+    
+    def geocode_many(self, addresses: List[str], max_workers: int = 4) -> List[Optional[Dict]]:
+        """Geocode several addresses concurrently, returning results in input order"""
+        # Each distinct address is looked up once; Nominatim calls stay rate limited
+        unique = {self._cache_key(address): address for address in addresses}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(zip(unique, executor.map(self.geocode_address, unique.values())))
+        return [results[self._cache_key(address)] for address in addresses]
+    
+    @staticmethod
+    def _cache_key(address: str) -> str:
+        """Normalize an address for cache lookups"""
+        return ' '.join(address.lower().split())
+    
+    def _geocode_uncached(self, address: str) -> Optional[Dict]:
+        """Look up GPS coordinates for an address via Google Maps, then OpenStreetMap"""
         print(f"Looking up GPS coordinates for: {address}")
         
         # Try Google Maps API first if key is available
         if self.api_key:
             try:
-                url = f"{self.base_url}/geocode/json"
-                params = {
-                    'address': address,
-                    'key': self.api_key
-                }
-                
-                response = requests.get(url, params=params, timeout=10)
+                response = self.session.get(self._geocode_url, params={**self._geocode_params, 'address': address},
+                                            timeout=10)
                 data = response.json()
                 
                 if data['status'] == 'OK' and data['results']:
@@ -71,57 +250,86 @@ class GoogleMapsIntegration:
         print("[ERROR] Could not find GPS coordinates for this address")
         return None
     
+    def _wait_for_nominatim_slot(self):
+        """Space requests to honour Nominatim's rate limit, also across geocode_many threads"""
+        with self._nominatim_lock:
+            wait = self._last_nominatim_request + NOMINATIM_MIN_INTERVAL - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_nominatim_request = time.monotonic()
+    
+    def _nominatim_get(self, params: Dict) -> requests.Response:
+        """Stream a Nominatim search, retrying transient failures within the rate limit"""
+        for attempt in range(NOMINATIM_RETRIES + 1):
+            self._wait_for_nominatim_slot()
+            try:
+                response = self.session.get(self.NOMINATIM_URL, params=params, timeout=15, stream=True)
+            except requests.exceptions.ConnectionError:
+                if attempt == NOMINATIM_RETRIES:
+                    raise
+                retry_after = ''
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == NOMINATIM_RETRIES:
+                    return response
+                retry_after = response.headers.get('Retry-After', '')
+                response.close()
+            
+            # Back off by holding every thread's next slot, preferring the server's Retry-After
+            delay = int(retry_after) if retry_after.isdigit() else NOMINATIM_MIN_INTERVAL * 2 ** attempt
+            delay = min(delay, NOMINATIM_MAX_RETRY_AFTER)
+            print(f"Geocoding request failed, retrying in {delay}s")
+            with self._nominatim_lock:
+                self._last_nominatim_request = max(self._last_nominatim_request,
+                                                   time.monotonic() + delay - NOMINATIM_MIN_INTERVAL)
+    
     def _fallback_geocode(self, address: str) -> Optional[Dict]:
         """Fallback geocoding using OpenStreetMap Nominatim"""
         try:
-            url = "https://nominatim.openstreetmap.org/search"
-            params = {
-                'q': address,
-                'format': 'json',
-                'limit': 1,
-                'addressdetails': 1
-            }
+            params = {**self.NOMINATIM_PARAMS, 'q': address}
             
-            headers = {
-                'User-Agent': 'ElysianFields/1.0 (Cemetery Management System)'
-            }
+            # Stream the body so an oversized or misbehaving response is never read in full
+            with self._nominatim_get(params) as response:
+                if response.status_code != 200:
+                    print(f"Geocoding request failed with status: {response.status_code}")
+                    return None
+                
+                content_type = response.headers.get('Content-Type', '')
+                if 'json' not in content_type:
+                    print(f"Unexpected geocoding response type: {content_type}")
+                    return None
+                
+                if int(response.headers.get('Content-Length') or 0) > MAX_GEOCODE_RESPONSE_BYTES:
+                    print("Geocoding response too large")
+                    return None
+                
+                content = bytearray()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    content += chunk
+                    if len(content) > MAX_GEOCODE_RESPONSE_BYTES:
+                        print("Geocoding response too large")
+                        return None
             
-            print(f"Making request to: {url}")
-            print(f"Parameters: {params}")
+            # Check if response has content
+            if not content:
+                print("Empty response received")
+                return None
             
-            response = requests.get(url, params=params, headers=headers, timeout=15)
+            try:
+                data = json.loads(content)
+            except ValueError as json_error:
+                print(f"JSON parsing error: {json_error}")
+                return None
             
-            print(f"Response status: {response.status_code}")
-            print(f"Response content length: {len(response.content)}")
+            if data and isinstance(data, list):
+                result = data[0]
+                return {
+                    'latitude': float(result['lat']),
+                    'longitude': float(result['lon']),
+                    'formatted_address': result['display_name'],
+                    'place_id': result.get('place_id', '')
+                }
             
-            if response.status_code == 200:
-                # Check if response has content
-                if not response.content:
-                    print("Empty response received")
-                    return None
-                
-                try:
-                    data = response.json()
-                    print(f"Parsed JSON data: {type(data)}, length: {len(data) if isinstance(data, list) else 'not a list'}")
-                    
-                    if data and len(data) > 0:
-                        result = data[0]
-                        print(f"Found result: {result.get('display_name', 'No name')}")
-                        return {
-                            'latitude': float(result['lat']),
-                            'longitude': float(result['lon']),
-                            'formatted_address': result['display_name'],
-                            'place_id': result.get('place_id', '')
-                        }
-                    else:
-                        print(f"No results found for address: {address}")
-                except ValueError as json_error:
-                    print(f"JSON parsing error: {json_error}")
-                    print(f"Response content: {response.text[:200]}...")
-                    return None
-            else:
-                print(f"Geocoding request failed with status: {response.status_code}")
-                print(f"Response content: {response.text[:200]}...")
+            print(f"No results found for address: {address}")
                 
         except requests.exceptions.Timeout:
             print("Geocoding request timed out")
@@ -161,28 +369,20 @@ class GoogleMapsIntegration:
             icon=folium.Icon(color='red', icon='info-sign')
         ).add_to(m)
         
-        # Add plot markers
-        for plot in plots:
-            if plot.get('latitude') and plot.get('longitude'):
-                # Create popup content
-                individuals = plot.get('individuals', [])
-                popup_content = f"<b>Plot {plot.get('plot_number', 'Unknown')}</b><br>"
-                if plot.get('section'):
-                    popup_content += f"Section: {plot['section']}<br>"
-                if individuals:
-                    popup_content += "<br><b>Individuals:</b><br>"
-                    for individual in individuals:
-                        popup_content += f"• {individual.get('name', 'Unknown')}<br>"
-                        if individual.get('born_date'):
-                            popup_content += f"  Born: {individual['born_date']}<br>"
-                        if individual.get('died_date'):
-                            popup_content += f"  Died: {individual['died_date']}<br>"
-                
-                folium.Marker(
-                    [plot['latitude'], plot['longitude']],
-                    popup=folium.Popup(popup_content, max_width=300),
-                    icon=folium.Icon(color='blue', icon='home')
-                ).add_to(m)
+        # Add all plot markers as one GeoJSON layer instead of one folium.Marker per plot
+        features = [{
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': [plot['longitude'], plot['latitude']]},
+            'properties': {'popup': self._build_plot_popup(plot)}
+        } for plot in plots if plot.get('latitude') and plot.get('longitude')]
+        
+        if features:
+            folium.GeoJson(
+                {'type': 'FeatureCollection', 'features': features},
+                name='Plots',
+                popup=folium.GeoJsonPopup(fields=['popup'], labels=False, max_width=300),
+                marker=folium.Marker(icon=folium.Icon(color='blue', icon='home'))
+            ).add_to(m)
         
         # Add layer control
         folium.LayerControl().add_to(m)
@@ -198,6 +398,15 @@ class GoogleMapsIntegration:
         print(f"[SUCCESS] Map saved to: {map_path}")
         return str(map_path)
     
+    def _build_plot_popup(self, plot: Dict) -> str:
+        """Build the popup HTML for a plot marker"""
+        # Key the cache on just the fields the popup shows, so unchanged plots are cache hits
+        individuals = tuple(
+            (individual.get('name', 'Unknown'), individual.get('born_date'), individual.get('died_date'))
+            for individual in plot.get('individuals', [])
+        )
+        return _render_plot_popup(plot.get('plot_number', 'Unknown'), plot.get('section'), individuals)
+    
     def export_to_google_my_maps(self, cemetery_data: Dict, plots: List[Dict]) -> Dict:
         """Export cemetery data in Google My Maps compatible format"""
         kml_data = {
@@ -219,59 +428,79 @@ class GoogleMapsIntegration:
         
         return kml_data
     
-    def load_google_earth_kmz(self, kmz_file_path: str) -> List[Dict]:
+    def load_google_earth_kmz(self, kmz_file_path: str) -> PlotTable:
         """Load GPS coordinates from Google Earth KMZ file"""
-        import zipfile
-        import xml.etree.ElementTree as ET
-        
-        plots = []
+        tables = []
         
         try:
             with zipfile.ZipFile(kmz_file_path, 'r') as kmz:
                 # Find KML files
                 kml_files = [f for f in kmz.namelist() if f.endswith('.kml')]
-                
-                for kml_file in kml_files:
-                    kml_content = kmz.read(kml_file)
-                    plots.extend(self._parse_kml_content(kml_content))
+            
+            if len(kml_files) > 1:
+                # Inflate and lxml parsing both release the GIL, so layers parse in parallel;
+                # each worker opens its own ZipFile since one handle isn't safe to share
+                with ThreadPoolExecutor(max_workers=min(4, len(kml_files))) as executor:
+                    tables = list(executor.map(
+                        lambda kml_file: self._parse_kmz_member(kmz_file_path, kml_file), kml_files
+                    ))
+            else:
+                tables = [self._parse_kmz_member(kmz_file_path, kml_file) for kml_file in kml_files]
                     
         except Exception as e:
             print(f"Error loading KMZ file: {e}")
             
-        return plots
+        return PlotTable.concat(tables)
     
-    def _parse_kml_content(self, kml_content: bytes) -> List[Dict]:
-        """Parse KML content to extract plot data"""
-        import xml.etree.ElementTree as ET
-        
-        plots = []
+    def _parse_kmz_member(self, kmz_file_path: str, kml_file: str) -> PlotTable:
+        """Parse one KML member of a KMZ archive"""
+        with zipfile.ZipFile(kmz_file_path, 'r') as kmz:
+            # Stream the member into the parser rather than decompressing it into memory
+            with kmz.open(kml_file) as kml_stream:
+                return self._parse_kml_content(kml_stream)
+    
+    def _parse_kml_content(self, kml_content) -> PlotTable:
+        """Parse KML content (bytes or a file-like object) to extract plot data"""
+        names = []
+        descriptions = []
+        longitudes = []
+        latitudes = []
         
         try:
-            root = ET.fromstring(kml_content)
+            source = BytesIO(kml_content) if isinstance(kml_content, bytes) else kml_content
             
-            # Find all Placemark elements
-            for placemark in root.findall('.//{http://www.opengis.net/kml/2.2}Placemark'):
-                name_elem = placemark.find('.//{http://www.opengis.net/kml/2.2}name')
-                coord_elem = placemark.find('.//{http://www.opengis.net/kml/2.2}coordinates')
-                desc_elem = placemark.find('.//{http://www.opengis.net/kml/2.2}description')
+            # Stream Placemark elements instead of building the whole document tree
+            for _, placemark in etree.iterparse(source, tag=_TAG_PLACEMARK):
+                # name and description are direct children of the Placemark
+                name_elem = placemark.find(_TAG_NAME)
+                coord_texts = _COORDS_XPATH(placemark)
                 
-                if name_elem is not None and coord_elem is not None:
-                    name = name_elem.text or 'Unknown'
-                    coords = coord_elem.text.strip().split(',')
+                if name_elem is not None and coord_texts:
+                    coords = coord_texts[0].strip().split(',')
                     
                     if len(coords) >= 2:
-                        plot_data = {
-                            'plot_number': name,
-                            'latitude': float(coords[1]),
-                            'longitude': float(coords[0]),
-                            'description': desc_elem.text if desc_elem is not None else ''
-                        }
-                        plots.append(plot_data)
+                        names.append(name_elem.text or 'Unknown')
+                        descriptions.append(placemark.findtext(_TAG_DESC, ''))
+                        longitudes.append(coords[0])
+                        latitudes.append(coords[1])
+                
+                # Free the processed placemark and its earlier siblings
+                placemark.clear()
+                while placemark.getprevious() is not None:
+                    del placemark.getparent()[0]
+            
+            # Convert all coordinate strings in one pass instead of float() per placemark
+            return PlotTable(
+                names,
+                np.array(latitudes, dtype=np.float64),
+                np.array(longitudes, dtype=np.float64),
+                descriptions
+            )
                         
         except Exception as e:
             print(f"Error parsing KML: {e}")
             
-        return plots
+        return PlotTable.empty()
     
     def create_blueprint_overlay(self, cemetery_data: Dict, blueprint_image_path: str, 
                                 reference_points: List[Dict]) -> str:
@@ -280,9 +509,11 @@ class GoogleMapsIntegration:
             print("Reference points required for blueprint overlay")
             return None
         
+        # (N, 2) array of lat/lng so center and bounds are single vectorized reductions
+        points = np.array([(point['latitude'], point['longitude']) for point in reference_points], dtype=np.float64)
+        
         # Create base map
-        center_lat = sum(point['latitude'] for point in reference_points) / len(reference_points)
-        center_lng = sum(point['longitude'] for point in reference_points) / len(reference_points)
+        center_lat, center_lng = points.mean(axis=0).tolist()
         
         m = folium.Map(
             location=[center_lat, center_lng],
@@ -293,13 +524,7 @@ class GoogleMapsIntegration:
         # Add blueprint overlay
         if os.path.exists(blueprint_image_path):
             # Calculate bounds for the blueprint
-            lats = [point['latitude'] for point in reference_points]
-            lngs = [point['longitude'] for point in reference_points]
-            
-            bounds = [
-                [min(lats), min(lngs)],
-                [max(lats), max(lngs)]
-            ]
+            bounds = [points.min(axis=0).tolist(), points.max(axis=0).tolist()]
             
             # Add image overlay
             folium.raster_layers.ImageOverlay(
@@ -318,19 +543,19 @@ class GoogleMapsIntegration:
                 icon=folium.Icon(color='red', icon='info-sign')
             ).add_to(m)
         
-        # Save map
+        # Save map alongside the interactive maps
         map_file = f"blueprint_overlay_{cemetery_data.get('id', 'unknown')}.html"
-        m.save(map_file)
+        map_path = self.maps_dir / map_file
+        m.save(str(map_path))
         
-        return map_file
+        return str(map_path)
 
 class CemeteryMapManager:
     """Manages cemetery maps and GPS integration"""
     
     def __init__(self, api_key: Optional[str] = None):
         self.google_maps = GoogleMapsIntegration(api_key)
-        self.maps_dir = Path("maps")
-        self.maps_dir.mkdir(exist_ok=True)
+        self.maps_dir = ensure_maps_dir()
     
     def setup_cemetery_location(self, cemetery_name: str, address: str) -> Optional[Dict]:
         """Set up cemetery location using GPS coordinates"""
@@ -347,18 +572,18 @@ class CemeteryMapManager:
             print("[ERROR] Could not find GPS coordinates for the address")
             return None
     
-    def import_google_earth_data(self, kmz_file_path: str) -> List[Dict]:
+    def import_google_earth_data(self, kmz_file_path: str) -> PlotTable:
         """Import plot data from Google Earth KMZ file"""
         print(f"Importing data from {kmz_file_path}...")
         
         plots = self.google_maps.load_google_earth_kmz(kmz_file_path)
         
-        if plots:
-            print(f"[SUCCESS] Imported {len(plots)} plots from Google Earth")
-            for plot in plots[:5]:  # Show first 5 plots
-                print(f"   Plot {plot['plot_number']}: {plot['latitude']}, {plot['longitude']}")
-            if len(plots) > 5:
-                print(f"   ... and {len(plots) - 5} more plots")
+        if plots.size:
+            print(f"[SUCCESS] Imported {plots.size} plots from Google Earth")
+            for plot_number, latitude, longitude in zip(plots.plot_number[:5], plots.latitude[:5], plots.longitude[:5]):  # Show first 5 plots
+                print(f"   Plot {plot_number}: {latitude}, {longitude}")
+            if plots.size > 5:
+                print(f"   ... and {plots.size - 5} more plots")
         else:
             print("[ERROR] No plots found in the KMZ file")
             
@@ -4,6 +4,7 @@ A Python client for mobile devices (Android) to interact with the backend API
 
 Dependencies:
 - requests
+- requests-toolbelt
 - pillow (PIL)
 - pytesseract
 
@@ -11,12 +12,22 @@ Author: Project Elysian Fields Development Team
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_toolbelt.multipart.encoder import MultipartEncoder
 import json
 import os
 from pathlib import Path
 from PIL import Image
 import pytesseract
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Concurrent uploads in batch_upload_photos; the session pool is sized to match
+UPLOAD_WORKERS = 8
+
+# Photo files picked up by batch_upload_photos
+PHOTO_SUFFIXES = ('.jpg', '.jpeg', '.png')
 
 class ElysianFieldsClient:
     """Client for interacting with Elysian Fields backend API"""
@@ -24,6 +35,11 @@ class ElysianFieldsClient:
     def __init__(self, base_url="http://localhost:5000/api"):
         self.base_url = base_url
         self.session = requests.Session()
+        # Keep-alive connections to the backend, retried if the server is briefly unavailable
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=UPLOAD_WORKERS * 4, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
     def health_check(self):
         """Check if the backend is running"""
@@ -43,10 +59,26 @@ class ElysianFieldsClient:
         response = self.session.post(f"{self.base_url}/cemeteries", json=data)
         return response.json() if response.status_code == 201 else None
     
+    def _get_all_pages(self, url):
+        """GET a paginated list endpoint, following Link rel="next" headers"""
+        items = []
+        while url:
+            response = self.session.get(url)
+            if response.status_code != 200:
+                return items
+            items.extend(response.json())
+            url = response.links.get('next', {}).get('url')
+        return items
+    
     def get_cemeteries(self):
         """Get all cemeteries"""
-        response = self.session.get(f"{self.base_url}/cemeteries")
-        return response.json() if response.status_code == 200 else []
+        return self._get_all_pages(f"{self.base_url}/cemeteries")
+    
+    def get_cemetery_by_name(self, name):
+        """Get the cemetery with exactly this name, or None"""
+        response = self.session.get(f"{self.base_url}/cemeteries", params={'name': name})
+        cemeteries = response.json() if response.status_code == 200 else []
+        return cemeteries[0] if cemeteries else None
     
     def create_plot(self, cemetery_id, plot_number, section="", row="", latitude=None, longitude=None):
         """Create a new plot"""
@@ -72,17 +104,29 @@ class ElysianFieldsClient:
         response = self.session.post(f"{self.base_url}/plots/{plot_id}/individuals", json=data)
         return response.json() if response.status_code == 201 else None
     
+    def add_individuals_bulk(self, plot_id, individuals):
+        """Add several individuals (dicts of add_individual's fields) to a plot in one request"""
+        response = self.session.post(f"{self.base_url}/plots/{plot_id}/individuals/bulk",
+                                     json={"individuals": individuals})
+        return response.json() if response.status_code == 201 else None
+    
+    def _post_file(self, url, file_path, data=None):
+        """POST a file as multipart/form-data, streaming it from disk instead of buffering it"""
+        with open(file_path, 'rb') as f:
+            fields = dict(data or {})
+            fields['file'] = (os.path.basename(file_path), f, 'application/octet-stream')
+            encoder = MultipartEncoder(fields=fields)
+            return self.session.post(url, data=encoder, headers={'Content-Type': encoder.content_type})
+    
     def upload_photo(self, plot_id, image_path, photo_type="headstone"):
         """Upload a photo for a plot"""
         if not os.path.exists(image_path):
             return None
         
-        with open(image_path, 'rb') as f:
-            files = {'file': f}
-            data = {'photo_type': photo_type}
-            response = self.session.post(f"{self.base_url}/plots/{plot_id}/photos", files=files, data=data)
+        response = self._post_file(f"{self.base_url}/plots/{plot_id}/photos", image_path,
+                                   {'photo_type': photo_type})
         
-        return response.json() if response.status_code == 201 else None
+        return response.json() if response.status_code in (201, 202) else None
     
     def upload_360_photo(self, plot_id, image_path):
         """Upload a 360-degree photo"""
@@ -93,13 +137,11 @@ class ElysianFieldsClient:
         if not os.path.exists(image_path):
             return None
         
-        with open(image_path, 'rb') as f:
-            files = {'file': f}
-            data = {
-                'description': description,
-                'scale': str(scale)
-            }
-            response = self.session.post(f"{self.base_url}/cemeteries/{cemetery_id}/blueprints", files=files, data=data)
+        data = {
+            'description': description,
+            'scale': str(scale)
+        }
+        response = self._post_file(f"{self.base_url}/cemeteries/{cemetery_id}/blueprints", image_path, data)
         
         return response.json() if response.status_code == 201 else None
     
@@ -108,9 +150,7 @@ class ElysianFieldsClient:
         if not os.path.exists(kmz_path):
             return None
         
-        with open(kmz_path, 'rb') as f:
-            files = {'file': f}
-            response = self.session.post(f"{self.base_url}/cemeteries/{cemetery_id}/import-kmz", files=files)
+        response = self._post_file(f"{self.base_url}/cemeteries/{cemetery_id}/import-kmz", kmz_path)
         
         return response.json() if response.status_code == 201 else None
     
@@ -121,8 +161,7 @@ class ElysianFieldsClient:
     
     def get_plots(self, cemetery_id):
         """Get all plots for a cemetery"""
-        response = self.session.get(f"{self.base_url}/cemeteries/{cemetery_id}/plots")
-        return response.json() if response.status_code == 200 else []
+        return self._get_all_pages(f"{self.base_url}/cemeteries/{cemetery_id}/plots")
     
     def export_google_maps(self, cemetery_id):
         """Export cemetery data for Google My Maps"""
@@ -138,8 +177,7 @@ class MobileWorkflow:
     def setup_cemetery(self, cemetery_name, location="", description=""):
         """Set up a new cemetery"""
         # Check if cemetery already exists
-        cemeteries = self.client.get_cemeteries()
-        existing = next((c for c in cemeteries if c['name'] == cemetery_name), None)
+        existing = self.client.get_cemetery_by_name(cemetery_name)
         
         if existing:
             print(f"Cemetery '{cemetery_name}' already exists")
@@ -169,17 +207,9 @@ class MobileWorkflow:
         if photo_result:
             print(f"Uploaded headstone photo for plot {plot_number}")
         
-        # Add individuals
-        for individual in individuals_data:
-            result = self.client.add_individual(
-                plot_id,
-                individual['name'],
-                individual.get('born_date'),
-                individual.get('died_date'),
-                individual.get('epitaph', ''),
-                individual.get('relationship', '')
-            )
-            if result:
+        # Add all individuals in one request
+        if individuals_data:
+            for individual in self.client.add_individuals_bulk(plot_id, individuals_data) or []:
                 print(f"Added individual: {individual['name']}")
         
         return True
@@ -191,21 +221,34 @@ class MobileWorkflow:
             print(f"Directory {photos_directory} does not exist")
             return
         
-        uploaded_count = 0
-        for photo_file in photos_dir.glob("*.jpg"):
-            # Extract plot number from filename (assuming format: plot_123.jpg)
-            plot_number = photo_file.stem.replace("plot_", "")
-            
-            # Create plot
-            plot = self.client.create_plot(cemetery_id, plot_number)
-            if plot:
-                # Upload photo
-                result = self.client.upload_photo(plot['id'], str(photo_file), photo_type)
-                if result:
-                    uploaded_count += 1
-                    print(f"Uploaded {photo_file.name}")
+        # Each photo is an independent plot + upload, so run them concurrently over the pooled session
+        # One scandir pass, matching extensions case-insensitively (plot_1.JPG, plot_2.jpeg, ...)
+        with os.scandir(photos_dir) as entries:
+            photo_files = [Path(entry.path) for entry in entries
+                           if entry.is_file() and entry.name.lower().endswith(PHOTO_SUFFIXES)]
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+            results = executor.map(
+                lambda photo_file: self._upload_plot_photo(cemetery_id, photo_file, photo_type),
+                photo_files
+            )
+            uploaded_count = sum(1 for uploaded in results if uploaded)
         
         print(f"Successfully uploaded {uploaded_count} photos")
+    
+    def _upload_plot_photo(self, cemetery_id, photo_file, photo_type):
+        """Create the plot named by a photo file and upload the photo to it"""
+        # Extract plot number from filename (assuming format: plot_123.jpg)
+        plot_number = photo_file.stem.replace("plot_", "")
+        
+        # Create plot
+        plot = self.client.create_plot(cemetery_id, plot_number)
+        if plot:
+            # Upload photo
+            result = self.client.upload_photo(plot['id'], str(photo_file), photo_type)
+            if result:
+                print(f"Uploaded {photo_file.name}")
+                return True
+        return False
 
 # Example usage
 if __name__ == "__main__":
@@ -5,38 +5,257 @@ Automatically processes all images in a folder and creates a database
 
 import os
 import sys
-import pandas as pd
+import csv
+import json
 import pytesseract
 from PIL import Image
 import re
-from pathlib import Path
+import hashlib
+import mmap
+import zlib
+import sqlite3
+import tempfile
+from collections import deque
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor
 import argparse
+import atexit
+from functools import lru_cache
+from multiprocessing import Pool, cpu_count
+
+# tesserocr (optional) keeps Tesseract loaded in-process instead of spawning it per call
+try:
+    from tesserocr import PyTessBaseAPI
+except ImportError:
+    PyTessBaseAPI = None
+
+# pyarrow (optional) writes the results CSV in C++ instead of row by row in Python
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+
+# Per-worker tesserocr API, created by _init_worker
+_tess_api = None
+
+# OCR worker pool shared by every process_folder call, and the (workers, tesseract_cmd) it was built for
+_pool = None
+_pool_settings = None
+
+# Where the Windows installer puts Tesseract
+DEFAULT_TESSERACT_PATH = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+
+# Images per Tesseract run in list-file mode; very long lists can stall pytesseract's output pipe
+OCR_BATCH_SIZE = 50
+
+# Images decoded ahead of the one being OCR'd in per-image mode
+PREFETCH_DEPTH = 4
+
+# Dates on a headstone: "12 March 1900", "March 12, 1900", "3/12/1900" or a bare year
+_MONTHS = r'(?:January|February|March|April|May|June|July|August|September|October|November|December)'
+_DATE_RE = re.compile(
+    rf'\b(\d{{1,2}}\s+{_MONTHS}\s+\d{{4}}|{_MONTHS}\s+\d{{1,2}},?\s+\d{{4}}'
+    r'|\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4})\b',
+    re.IGNORECASE
+)
+
+# Longest side, in pixels, of an image handed to Tesseract; runtime grows with pixel count
+# and headstone lettering stays legible well below phone-camera resolution
+OCR_MAX_DIMENSION = 2000
+
+# Images with fewer pixels than this (e.g. thumbnails, icons) are skipped without OCR
+MIN_OCR_PIXELS = 50 * 50
+
+# Images between progress lines in process_folder
+PROGRESS_EVERY = 100
+
+# Columns of the results CSV, in order
+RESULT_FIELDS = ['image_filename', 'image_path', 'extracted_text', 'name', 'born_date', 'died_date', 'epitaph']
+
+# Records converted per pyarrow table when writing the results CSV
+CSV_BATCH_SIZE = 10000
+
+# OCR text keyed by image content hash, shared across runs and folders
+OCR_CACHE_PATH = 'batch_ocr_cache.db'
+
+@lru_cache(maxsize=1)
+def _find_default_tesseract():
+    """The default Tesseract install path if it exists, probed once per process"""
+    return DEFAULT_TESSERACT_PATH if os.path.exists(DEFAULT_TESSERACT_PATH) else None
+
+def _get_pool(workers, tesseract_cmd):
+    """Return the shared OCR pool, starting it (again) only when its settings change"""
+    global _pool, _pool_settings
+    if _pool is None or _pool_settings != (workers, tesseract_cmd):
+        _close_pool()
+        # One Tesseract thread per process keeps the workers from oversubscribing the cores
+        os.environ['OMP_THREAD_LIMIT'] = '1'
+        _pool = Pool(workers, initializer=_init_worker, initargs=(tesseract_cmd,))
+        _pool_settings = (workers, tesseract_cmd)
+    return _pool
+
+@atexit.register
+def _close_pool(terminate=False):
+    """Shut the shared OCR pool down, abandoning queued work if terminate is set"""
+    global _pool, _pool_settings
+    if _pool is not None:
+        if terminate:
+            _pool.terminate()
+        else:
+            _pool.close()
+        _pool.join()
+        _pool = None
+        _pool_settings = None
+
+def _init_worker(tesseract_cmd):
+    """Pool initializer: load tesserocr once per worker, or point pytesseract at the parent's binary"""
+    global _tess_api
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    if PyTessBaseAPI is not None:
+        try:
+            _tess_api = PyTessBaseAPI(lang='eng')
+        except RuntimeError as e:
+            print(f"tesserocr unavailable, using the tesseract executable: {e}")
+
+def prepare_for_ocr(image):
+    """Shrink an image to OCR_MAX_DIMENSION and convert it to grayscale"""
+    # thumbnail() runs before the pixels are decoded, so JPEGs are decoded at reduced size
+    image.thumbnail((OCR_MAX_DIMENSION, OCR_MAX_DIMENSION), Image.LANCZOS)
+    return image.convert('L')
+
+def _load_image(image_path):
+    """Read, decode and shrink an image fully, so OCR never waits on the disk"""
+    with Image.open(image_path) as image:
+        return prepare_for_ocr(image)
+
+def _ocr_copy(image_path, copy_path):
+    """Path of a single-page image Tesseract can read at OCR size: the original, or a shrunk copy of it"""
+    with Image.open(image_path) as image:
+        # A multi-page TIFF would add pages to a list run, so it gets a copy of its first frame
+        if max(image.size) <= OCR_MAX_DIMENSION and getattr(image, 'n_frames', 1) == 1:
+            return os.path.abspath(image_path)
+        prepare_for_ocr(image).save(copy_path)
+    return copy_path
+
+def _ocr_images(image_paths):
+    """OCR images one at a time while a background thread decodes the next few"""
+    results = []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pending = deque()
+        for image_path in image_paths:
+            pending.append((image_path, executor.submit(_load_image, image_path)))
+            if len(pending) > PREFETCH_DEPTH:
+                results.append(_ocr_loaded(*pending.popleft()))
+        while pending:
+            results.append(_ocr_loaded(*pending.popleft()))
+    return results
+
+def _ocr_loaded(image_path, future):
+    """OCR an image once its background decode has finished"""
+    try:
+        image = future.result()
+    except Exception as e:
+        print(f"Error processing {image_path}: {e}")
+        return image_path, None
+    return BatchOCRProcessor.process_single_image(image_path, image)
+
+def _ocr_chunk(image_paths):
+    """OCR a chunk of images with one Tesseract run, in a worker process (module level so it can be pickled)"""
+    if _tess_api is not None:
+        # The model is already loaded in this worker, so there is no startup to amortize
+        return _ocr_images(image_paths)
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Oversized images are shrunk into the temporary directory first
+            ocr_paths = [_ocr_copy(path, os.path.join(temp_dir, f'{i}.png')) for i, path in enumerate(image_paths)]
+            
+            # Tesseract treats a .txt input as a list of images, one path per line,
+            # so the language model is loaded once per chunk rather than once per image
+            list_path = os.path.join(temp_dir, 'images.txt')
+            with open(list_path, 'w') as list_file:
+                list_file.write('\n'.join(ocr_paths))
+            
+            ocr_output = pytesseract.image_to_string(list_path)
+        
+        # Each page's text is terminated by a form feed, so n pages split into n + 1 pieces;
+        # any other count means the pages no longer line up with the files
+        pages = ocr_output.split('\x0c')
+        if len(pages) != len(image_paths) + 1:
+            raise ValueError(f"expected {len(image_paths)} pages, got {len(pages) - 1}")
+        return [BatchOCRProcessor.build_result(path, page) for path, page in zip(image_paths, pages)]
+    except Exception as e:
+        print(f"Batch OCR error, falling back to one image at a time: {e}")
+        return _ocr_images(image_paths)
+
+def file_sha1(path):
+    """SHA-1 of a file's contents, hashed straight from a memory map of the file"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files can't be mapped
+            return hashlib.sha1().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha1(mapped).hexdigest()
+
+class OCRCache:
+    """Persistent SQLite store of OCR text by image SHA-1"""
+    
+    def __init__(self, db_path):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS ocr_cache (sha1 TEXT PRIMARY KEY, extracted_text TEXT NOT NULL)'
+        )
+    
+    def get(self, image_hash):
+        row = self.conn.execute('SELECT extracted_text FROM ocr_cache WHERE sha1 = ?', (image_hash,)).fetchone()
+        return row[0] if row else None
+    
+    def put(self, image_hash, extracted_text):
+        self.conn.execute('INSERT OR REPLACE INTO ocr_cache VALUES (?, ?)', (image_hash, extracted_text))
+    
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
 
 class BatchOCRProcessor:
-    def __init__(self, tesseract_path=None):
+    def __init__(self, tesseract_path=None, workers=None, cache_path=OCR_CACHE_PATH):
         """Initialize the batch OCR processor"""
         if tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
         else:
             # Try default path
-            default_path = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-            if os.path.exists(default_path):
+            default_path = _find_default_tesseract()
+            if default_path:
                 pytesseract.pytesseract.tesseract_cmd = default_path
         
-        self.results = []
+        self.workers = workers or cpu_count()
+        self.cache_path = cache_path
     
-    def process_folder(self, folder_path, output_csv=None):
-        """Process all images in a folder"""
+    def process_folder(self, folder_path, output_csv=None, shard=None):
+        """Process all images in a folder, or only shard (index, count) of them, counting from 1"""
         print(f"🔍 Processing folder: {folder_path}")
         print("=" * 50)
         
         # Get all image files
         image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'}
-        image_files = []
+        with os.scandir(folder_path) as entries:
+            image_stats = {
+                entry.path: entry.stat() for entry in entries
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in image_extensions
+            }
+        image_files = list(image_stats)
         
-        for file in os.listdir(folder_path):
-            if Path(file).suffix.lower() in image_extensions:
-                image_files.append(os.path.join(folder_path, file))
+        # Shards split a folder between machines (e.g. on a network share) by a stable hash of
+        # each filename, so every machine picks its own images without coordinating
+        results_name = "batch_ocr_results"
+        if shard:
+            index, count = shard
+            image_files = [
+                path for path in image_files
+                if zlib.crc32(os.path.basename(path).encode()) % count == index - 1
+            ]
+            results_name += f"_{index}of{count}"
         
         if not image_files:
             print("❌ No image files found in the folder")
@@ -45,84 +264,167 @@ class BatchOCRProcessor:
         print(f"📸 Found {len(image_files)} image files")
         print("-" * 30)
         
+        if output_csv:
+            csv_path = output_csv
+        else:
+            csv_path = os.path.join(folder_path, f"{results_name}.csv")
+        
+        # Records are appended to a JSONL file as they finish, with each image's size and
+        # mtime, so an interrupted run resumes from where it stopped instead of starting over
+        jsonl_path = os.path.splitext(csv_path)[0] + '.jsonl'
+        completed = self.load_completed(jsonl_path, image_stats)
+        if completed:
+            image_files = [path for path in image_files if os.path.basename(path) not in completed]
+            print(f"⏭️  Skipping {len(completed)} images already in {jsonl_path}")
+        
         # Process each image
         successful = 0
         failed = 0
         
-        for i, image_path in enumerate(image_files, 1):
-            print(f"Processing {i}/{len(image_files)}: {os.path.basename(image_path)}")
-            
-            try:
-                result = self.process_single_image(image_path)
-                if result:
-                    self.results.append(result)
-                    successful += 1
-                    print(f"  ✅ Extracted: {result['name']}")
-                else:
-                    failed += 1
-                    print(f"  ❌ No text extracted")
-            except Exception as e:
-                failed += 1
-                print(f"  ❌ Error: {e}")
+        # Images OCR'd on an earlier run (here or in another folder) reuse the cached text;
+        # hashing is far cheaper than OCR. The rest are vetted from their headers alone,
+        # so a corrupt or misnamed file never reaches (and derails) a Tesseract batch and
+        # thumbnails or icons don't cost a full Tesseract pass.
+        cache = OCRCache(self.cache_path)
+        known_results = []
+        uncached_hashes = {}
+        cache_hits = 0
+        for image_path in image_files:
+            image_hash = file_sha1(image_path)
+            extracted_text = cache.get(image_hash)
+            if extracted_text is not None:
+                known_results.append(self.build_result(image_path, extracted_text))
+                cache_hits += 1
+            elif self.worth_ocr(image_path):
+                uncached_hashes[image_path] = image_hash
+            else:
+                known_results.append((image_path, None))
+        
+        if cache_hits:
+            print(f"♻️  {cache_hits} images found in the OCR cache")
+        
+        # Each image is independent, so OCR them across processes. The pool outlives this
+        # call, so processing several folders in one session starts the workers only once.
+        # Chunks are capped at OCR_BATCH_SIZE but kept small enough to give every worker some work
+        to_ocr = list(uncached_hashes)
+        chunk_size = max(1, min(OCR_BATCH_SIZE, -(-len(to_ocr) // self.workers)))
+        chunks = [to_ocr[start:start + chunk_size] for start in range(0, len(to_ocr), chunk_size)]
+        try:
+            with open(jsonl_path, 'a', encoding='utf-8') as records:
+                ocr_results = ()
+                if chunks:
+                    pool = _get_pool(self.workers, pytesseract.pytesseract.tesseract_cmd)
+                    ocr_results = (item for chunk in pool.imap_unordered(_ocr_chunk, chunks) for item in chunk)
+                for i, (image_path, result) in enumerate(chain(known_results, ocr_results), 1):
+                    if result:
+                        if image_path in uncached_hashes:
+                            cache.put(uncached_hashes[image_path], result['extracted_text'])
+                        st = image_stats[image_path]
+                        record = dict(result, file_size=st.st_size, file_mtime_ns=st.st_mtime_ns)
+                        records.write(json.dumps(record) + '\n')
+                        records.flush()
+                        successful += 1
+                    else:
+                        failed += 1
+                        print(f"  ❌ No text extracted: {os.path.basename(image_path)}")
+                    
+                    # Progress is reported every PROGRESS_EVERY images; a line per image
+                    # costs more than the OCR itself once results come from the cache
+                    if i % PROGRESS_EVERY == 0 or i == len(image_files):
+                        print(f"Processed {i}/{len(image_files)} ({successful} extracted, {failed} failed)")
+        except BaseException:
+            # Don't leave this batch's remaining chunks queued for the next call
+            _close_pool(terminate=True)
+            raise
+        finally:
+            cache.close()
         
         # Save results
-        if self.results:
-            if output_csv:
-                csv_path = output_csv
-            else:
-                csv_path = os.path.join(folder_path, "batch_ocr_results.csv")
-            
-            self.save_results(csv_path)
+        total_records = len(completed) + successful
+        if total_records:
+            self.save_results(jsonl_path, csv_path)
             print(f"\n✅ Results saved to: {csv_path}")
         
         print(f"\n📊 Summary:")
         print(f"  ✅ Successful: {successful}")
         print(f"  ❌ Failed: {failed}")
-        print(f"  📄 Total records: {len(self.results)}")
+        print(f"  📄 Total records: {total_records}")
+    
+    @staticmethod
+    def read_image_size(image_path):
+        """Read an image's size from its header without decoding the pixels, or None if it can't be read"""
+        try:
+            with Image.open(image_path) as image:
+                return image.size
+        except Exception as e:
+            print(f"Skipping unreadable image {image_path}: {e}")
+            return None
     
-    def process_single_image(self, image_path):
-        """Process a single image with OCR"""
+    @staticmethod
+    def worth_ocr(image_path):
+        """Whether an image is readable and large enough to hold legible text, judged from its header"""
+        size = BatchOCRProcessor.read_image_size(image_path)
+        if not size:
+            return False
+        width, height = size
+        if width * height < MIN_OCR_PIXELS:
+            print(f"Skipping {width}x{height} image {image_path}: too small to OCR")
+            return False
+        return True
+    
+    @staticmethod
+    def process_single_image(image_path, image=None):
+        """Process a single image with OCR, returning (image_path, result or None)"""
         try:
-            # Load image
-            image = Image.open(image_path)
+            # Load and shrink the image, unless that was already done ahead of time
+            if image is None:
+                image = _load_image(image_path)
             
             # Run OCR
-            extracted_text = pytesseract.image_to_string(image)
-            
-            if not extracted_text.strip():
-                return None
-            
-            # Parse the text
-            parsed_data = self.parse_ocr_text(extracted_text)
+            if _tess_api is not None:
+                # Pass the raw 8-bit grayscale buffer; SetImage would re-encode the image to BMP first
+                width, height = image.size
+                _tess_api.SetImageBytes(image.tobytes(), width, height, 1, width)
+                extracted_text = _tess_api.GetUTF8Text()
+            else:
+                extracted_text = pytesseract.image_to_string(image)
             
-            return {
-                'image_filename': os.path.basename(image_path),
-                'image_path': image_path,
-                'extracted_text': extracted_text,
-                'name': parsed_data['name'],
-                'born_date': parsed_data['born_date'],
-                'died_date': parsed_data['died_date'],
-                'epitaph': parsed_data['epitaph']
-            }
+            return BatchOCRProcessor.build_result(image_path, extracted_text)
             
         except Exception as e:
             print(f"Error processing {image_path}: {e}")
-            return None
+            return image_path, None
     
-    def parse_ocr_text(self, text):
-        """Parse OCR text to extract structured data"""
-        # Clean up text
-        text = text.strip()
+    @staticmethod
+    def build_result(image_path, extracted_text):
+        """Turn an image's OCR text into (image_path, result or None)"""
+        if not extracted_text.strip():
+            return image_path, None
         
-        # Split into lines
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        # Parse the text
+        parsed_data = BatchOCRProcessor.parse_ocr_text(extracted_text)
+        
+        return image_path, {
+            'image_filename': os.path.basename(image_path),
+            'image_path': image_path,
+            'extracted_text': extracted_text,
+            'name': parsed_data['name'],
+            'born_date': parsed_data['born_date'],
+            'died_date': parsed_data['died_date'],
+            'epitaph': parsed_data['epitaph']
+        }
+    
+    @staticmethod
+    def parse_ocr_text(text):
+        """Parse OCR text to extract structured data"""
+        # Split into non-empty lines, stripping each one once
+        lines = [line for raw_line in text.splitlines() if (line := raw_line.strip())]
         
         # Extract name (usually first line)
         name = lines[0] if lines else 'Unknown'
         
         # Extract dates
-        date_pattern = r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4})\b'
-        dates = re.findall(date_pattern, text)
+        dates = _DATE_RE.findall(text)
         
         born_date = None
         died_date = None
@@ -147,14 +449,68 @@ class BatchOCRProcessor:
             'epitaph': epitaph
         }
     
-    def save_results(self, csv_path):
-        """Save results to CSV file"""
-        if not self.results:
-            return
+    @staticmethod
+    def load_completed(jsonl_path, image_stats):
+        """Filenames already recorded in a results JSONL file for the image as it is now on disk.
+        
+        Records of images whose size or modification time changed since are dropped from the
+        file, so those images are OCR'd again.
+        """
+        if not os.path.exists(jsonl_path):
+            return set()
         
-        df = pd.DataFrame(self.results)
-        df.to_csv(csv_path, index=False)
-        print(f"💾 Saved {len(self.results)} records to CSV")
+        current = {os.path.basename(path): (st.st_size, st.st_mtime_ns) for path, st in image_stats.items()}
+        completed = set()
+        stale = 0
+        kept_path = jsonl_path + '.tmp'
+        with open(jsonl_path, 'rb') as f, open(kept_path, 'wb') as kept:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # A run killed mid-write leaves a truncated last line
+                    break
+                record = json.loads(line)
+                filename = record['image_filename']
+                if filename in current and current[filename] != (record.get('file_size'), record.get('file_mtime_ns')):
+                    stale += 1
+                    continue
+                completed.add(filename)
+                kept.write(line)
+        os.replace(kept_path, jsonl_path)
+        
+        if stale:
+            print(f"🔄 {stale} images changed since they were processed and will be redone")
+        return completed
+    
+    @staticmethod
+    def save_results(jsonl_path, csv_path):
+        """Convert the results JSONL file to CSV, a batch (or without pyarrow, a record) at a time"""
+        count = 0
+        with open(jsonl_path, encoding='utf-8') as records:
+            if pa is not None:
+                schema = pa.schema([(field, pa.string()) for field in RESULT_FIELDS])
+                with pa_csv.CSVWriter(csv_path, schema) as writer:
+                    for batch in iter(lambda: list(islice(records, CSV_BATCH_SIZE)), []):
+                        rows = [json.loads(line) for line in batch]
+                        writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+                        count += len(rows)
+            else:
+                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS, extrasaction='ignore')
+                    writer.writeheader()
+                    for line in records:
+                        writer.writerow(json.loads(line))
+                        count += 1
+        print(f"💾 Saved {count} records to CSV")
+
+def parse_shard(value):
+    """Parse a --shard value such as '2/4' into (2, 4)"""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected INDEX/COUNT, got {value!r}")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard index must be between 1 and {count}")
+    return index, count
 
 def main():
     """Main function"""
@@ -162,6 +518,10 @@ def main():
     parser.add_argument('folder', help='Folder containing gravestone images')
     parser.add_argument('--output', '-o', help='Output CSV file path')
     parser.add_argument('--tesseract', '-t', help='Path to Tesseract executable')
+    parser.add_argument('--workers', '-w', type=int, help='Number of OCR processes (default: CPU count)')
+    parser.add_argument('--cache', default=OCR_CACHE_PATH, help=f'OCR cache database (default: {OCR_CACHE_PATH})')
+    parser.add_argument('--shard', type=parse_shard, metavar='INDEX/COUNT',
+                        help='Process only this share of the folder, e.g. 2/4 on the second of four machines')
     
     args = parser.parse_args()
     
@@ -170,10 +530,10 @@ def main():
         return 1
     
     # Initialize processor
-    processor = BatchOCRProcessor(args.tesseract)
+    processor = BatchOCRProcessor(args.tesseract, args.workers, args.cache)
     
     # Process folder
-    processor.process_folder(args.folder, args.output)
+    processor.process_folder(args.folder, args.output, args.shard)
     
     return 0
 
@@ -15,10 +15,10 @@ import shutil
 from pathlib import Path
 
 def run_command(command, description):
-    """Run a command and handle errors"""
+    """Run a command (an argv list, no shell) and handle errors"""
     print(f"Running: {description}")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
         print(f"✓ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -36,13 +36,9 @@ def check_python_version():
 
 def check_tesseract():
     """Check if Tesseract is installed"""
-    try:
-        result = subprocess.run("tesseract --version", shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✓ Tesseract OCR is installed")
-            return True
-    except:
-        pass
+    if shutil.which("tesseract"):
+        print("✓ Tesseract OCR is installed")
+        return True
     
     print("✗ Tesseract OCR is not installed")
     print("Please install Tesseract from: https://github.com/UB-Mannheim/tesseract/wiki")
@@ -52,24 +48,19 @@ def install_dependencies():
     """Install Python dependencies"""
     print("\n=== Installing Dependencies ===")
     
-    # Backend dependencies
-    if not run_command("pip install -r backend/requirements.txt", "Installing backend dependencies"):
-        return False
-    
     # Additional dependencies for desktop app
     desktop_deps = [
         "customtkinter",
         "opencv-python",
         "numpy",
         "pandas",
-        "requests"
+        "requests",
+        "requests-toolbelt"
     ]
     
-    for dep in desktop_deps:
-        if not run_command(f"pip install {dep}", f"Installing {dep}"):
-            return False
-    
-    return True
+    # Backend and desktop dependencies go through one pip run, so they are resolved together once
+    command = [sys.executable, "-m", "pip", "install", "-r", "backend/requirements.txt", *desktop_deps]
+    return run_command(command, "Installing backend and desktop dependencies")
 
 def setup_directories():
     """Create necessary directories"""
@@ -119,8 +110,9 @@ def test_backend():
         from app import app
         
         with app.app_context():
-            from app import db
+            from app import db, setup_search_indexes
             db.create_all()
+            setup_search_indexes()
         
         print("✓ Backend imports successfully")
         print("✓ Database tables created")
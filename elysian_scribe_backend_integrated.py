@@ -8,8 +8,10 @@ Dependencies:
 - numpy
 - opencv-python
 - pytesseract
+- tesserocr (optional, runs Tesseract in-process)
 - pandas
 - requests
+- requests-toolbelt
 
 Author: Project Elysian Fields Development Team
 """
@@ -22,26 +24,280 @@ import pandas as pd
 import numpy as np
 import cv2
 import os
+import re
+import tempfile
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+import mimetypes
 import json
 from pathlib import Path
 import tkinter as tk
 import math
+import queue
+import threading
 from datetime import datetime
+from functools import lru_cache, partial
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 
 # TESSERACT CONFIGURATION
 pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
 
+# LSTM engine only (skips the legacy engine) and a single uniform block of text, which
+# is what a headstone is (skips full page layout analysis); don't retry inverted text
+TESS_CONFIG = '--oem 1 --psm 6 -c tessedit_do_invert=0'
+
+# Run Tesseract single-threaded (unless the user says otherwise): its OpenMP threads cost more
+# than they save on headstone-sized images, and batch OCR gets its parallelism from processes.
+# Set before tesserocr loads libtesseract; pytesseract's subprocesses inherit it.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+# tesserocr (optional) keeps Tesseract loaded in-process instead of spawning it per OCR call
+try:
+    from tesserocr import PyTessBaseAPI, OEM, PSM
+except ImportError:
+    PyTessBaseAPI = None
+
+# tesserocr API of an auto batch OCR worker process, created by init_ocr_worker
+_worker_tess_api = None
+
 # Backend API Configuration
 BACKEND_URL = "http://localhost:5000/api"
 
+# Images per Tesseract run in auto batch OCR; very long lists can stall pytesseract's output pipe
+OCR_BATCH_SIZE = 40
+
+# Longest side, in pixels, of a photo handed to Tesseract; accuracy plateaus well below
+# phone-camera resolution while OCR time keeps growing with pixel count
+OCR_MAX_DIMENSION = 1500
+
+# Dates on a headstone: 1/2/1900, 01-02-00 or a bare year
+_DATE_RE = re.compile(r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4})\b')
+
+# Headstone photos are re-encoded before upload: longest side in pixels, and JPEG quality;
+# OCR has already been done locally, so the backend only needs a viewing-quality copy
+UPLOAD_MAX_DIMENSION = 2048
+UPLOAD_JPEG_QUALITY = 82
+
+# Auto batch OCR records sent to the backend per bulk-import request
+IMPORT_BATCH_SIZE = 100
+
+# Headstone photo file types, matched case-insensitively
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'})
+
+# Recently viewed images whose canvas-ready PhotoImage is kept for instant back-and-forth
+PHOTO_CACHE_SIZE = 8
+
+# Image decoder/resizer: 'cv2' (OpenCV's SIMD decode and resize) or 'pil'
+IMAGE_BACKEND = 'cv2'
+
 # Set appearance mode and color theme
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+def list_image_files(directory):
+    """Paths of the image files directly inside a directory, found in one scandir pass"""
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS]
+
+def load_image(image_path):
+    """Decode an image file into a PIL image (RGB when OpenCV decodes it)"""
+    if IMAGE_BACKEND == 'cv2':
+        # imdecode from a byte buffer, since cv2.imread can't open non-ASCII paths on Windows
+        pixels = cv2.imdecode(np.fromfile(str(image_path), dtype=np.uint8), cv2.IMREAD_COLOR)
+        if pixels is not None:
+            return Image.fromarray(cv2.cvtColor(pixels, cv2.COLOR_BGR2RGB))
+    return Image.open(image_path)
+
+@lru_cache(maxsize=256)
+def fit_size(width, height, max_width, max_height):
+    """Largest size within max_width x max_height with the same aspect ratio, never scaling up"""
+    scale = min(max_width / width, max_height / height, 1.0)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+def resize_image(image, size):
+    """Resize a PIL image for display"""
+    if IMAGE_BACKEND == 'cv2' and image.mode in ('RGB', 'RGBA', 'L'):
+        return Image.fromarray(cv2.resize(np.asarray(image), size, interpolation=cv2.INTER_AREA))
+    # Box-reduce most of the way, then finish bilinearly: close to LANCZOS at a tenth of the cost
+    return image.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+def rotate_image(image, angle):
+    """Rotate a PIL image angle degrees counter-clockwise, expanding it to fit and filling the corners white"""
+    if IMAGE_BACKEND == 'cv2' and image.mode in ('RGB', 'RGBA', 'L'):
+        pixels = np.asarray(image)
+        height, width = pixels.shape[:2]
+        matrix = cv2.getRotationMatrix2D(((width - 1) / 2, (height - 1) / 2), angle, 1.0)
+        
+        # Grow the output to the rotated bounding box and shift the image into its middle
+        cos, sin = abs(matrix[0, 0]), abs(matrix[0, 1])
+        new_width = math.ceil(height * sin + width * cos)
+        new_height = math.ceil(height * cos + width * sin)
+        matrix[0, 2] += (new_width - width) / 2
+        matrix[1, 2] += (new_height - height) / 2
+        
+        white = (255,) * pixels.shape[2] if pixels.ndim == 3 else 255
+        return Image.fromarray(cv2.warpAffine(pixels, matrix, (new_width, new_height),
+                                              flags=cv2.INTER_LINEAR, borderValue=white))
+    return image.rotate(angle, expand=True, fillcolor='white')
+
+@lru_cache(maxsize=32)
+def load_display_image(image_path, mtime_ns, max_width, max_height):
+    """Decode an image scaled to fit max_width x max_height, cached so revisiting it is free
+    (mtime_ns is part of the key so an edited file is decoded again)"""
+    image = load_image(image_path)
+    return resize_image(image, fit_size(*image.size, max_width, max_height))
+
+@lru_cache(maxsize=1)
+def load_gray_original(image_path, mtime_ns):
+    """Decode an image at full resolution as a grayscale array, keeping the last one since
+    several selections are usually OCR'd from the same photo"""
+    return np.asarray(load_image(image_path).convert('L'))
+
+def crop_selection(pixels, box, display_size, unrotated_size, angle):
+    """Cut the area under box, a selection on the displayed image, out of the full-size pixels.
+    The displayed image is the original scaled to unrotated_size, then rotated angle degrees by
+    rotate_image; the rotation is redone by one affine warp over just the selected area."""
+    scale = unrotated_size[0] / pixels.shape[1]  # displayed pixels per original pixel
+    x1, y1, x2, y2 = box
+    
+    # Selection centre as an offset from the displayed image's centre, rotated back and scaled up
+    dx = (x1 + x2) / 2 - display_size[0] / 2
+    dy = (y1 + y2) / 2 - display_size[1] / 2
+    cos, sin = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+    centre_x = pixels.shape[1] / 2 + (dx * cos - dy * sin) / scale
+    centre_y = pixels.shape[0] / 2 + (dx * sin + dy * cos) / scale
+    
+    # Rotate about that centre and move it to the middle of a selection-sized output
+    width, height = max(1, round((x2 - x1) / scale)), max(1, round((y2 - y1) / scale))
+    matrix = cv2.getRotationMatrix2D((centre_x, centre_y), angle, 1.0)
+    matrix[0, 2] += width / 2 - centre_x
+    matrix[1, 2] += height / 2 - centre_y
+    return cv2.warpAffine(pixels, matrix, (width, height), flags=cv2.INTER_LINEAR, borderValue=255)
+
+def binarize_for_ocr(pixels):
+    """Grayscale an RGB(A) or gray pixel array and adaptively threshold it, evening out
+    shading and stone texture before Tesseract"""
+    if pixels.ndim == 3:
+        pixels = cv2.cvtColor(pixels, cv2.COLOR_RGBA2GRAY if pixels.shape[2] == 4 else cv2.COLOR_RGB2GRAY)
+    
+    # The neighbourhood grows with the crop (odd, at least 31 px) so it stays wider than the
+    # letter strokes; a block narrower than a stroke leaves the letters hollow
+    block_size = max(31, max(pixels.shape) // 16 | 1)
+    return cv2.adaptiveThreshold(pixels, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, block_size, 10)
+
+def create_tess_api():
+    """Start an in-process Tesseract via tesserocr, or return None to use pytesseract"""
+    if PyTessBaseAPI is None:
+        return None
+    try:
+        api = PyTessBaseAPI(lang='eng', oem=OEM.LSTM_ONLY, psm=PSM.SINGLE_BLOCK)
+        api.SetVariable('tessedit_do_invert', '0')
+        return api
+    except RuntimeError as e:
+        print(f"tesserocr unavailable, using the tesseract executable: {e}")
+        return None
+
+def tess_image_to_string(api, pixels):
+    """OCR an 8-bit grayscale pixel array with a tesserocr API"""
+    height, width = pixels.shape
+    api.SetImageBytes(np.ascontiguousarray(pixels).tobytes(), width, height, 1, width)
+    return api.GetUTF8Text()
+
+def init_ocr_worker():
+    """ProcessPoolExecutor initializer: one Tesseract thread per worker process, so the
+    workers don't oversubscribe the cores even if OMP_THREAD_LIMIT was set higher"""
+    global _worker_tess_api
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+    _worker_tess_api = create_tess_api()
+
+def shrink_for_ocr(pixels):
+    """Downscale a pixel array so its longest side is at most OCR_MAX_DIMENSION"""
+    height, width = pixels.shape[:2]
+    scale = OCR_MAX_DIMENSION / max(height, width)
+    if scale >= 1:
+        return pixels
+    return cv2.resize(pixels, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA)
+
+def encode_upload_jpeg(image_path, max_dim=UPLOAD_MAX_DIMENSION, quality=UPLOAD_JPEG_QUALITY):
+    """Re-encode a photo as a progressive JPEG at most max_dim on its longest side (None if it can't be decoded)"""
+    pixels = cv2.imdecode(np.fromfile(str(image_path), dtype=np.uint8), cv2.IMREAD_COLOR)
+    if pixels is None:
+        return None
+    
+    height, width = pixels.shape[:2]
+    if max(height, width) > max_dim:
+        pixels = cv2.resize(pixels, fit_size(width, height, max_dim, max_dim), interpolation=cv2.INTER_AREA)
+    
+    ok, buffer = cv2.imencode('.jpg', pixels, [cv2.IMWRITE_JPEG_QUALITY, quality, cv2.IMWRITE_JPEG_PROGRESSIVE, 1])
+    return buffer.tobytes() if ok else None
+
+def load_ocr_pixels(image_path):
+    """Decode an image as a grayscale array sized for OCR"""
+    return shrink_for_ocr(np.asarray(load_image(image_path).convert('L')))
+
+def ocr_image_file(image_path):
+    """OCR one image file, returning '' if it can't be read"""
+    try:
+        pixels = load_ocr_pixels(image_path)
+        if _worker_tess_api is not None:
+            return tess_image_to_string(_worker_tess_api, pixels)
+        return pytesseract.image_to_string(pixels, config=TESS_CONFIG)
+    except Exception as e:
+        print(f"Error processing {image_path}: {e}")
+        return ''
+
+def ocr_list_entry(image_path, copy_path):
+    """Path Tesseract should read for an image: the file itself, or a shrunk single-page copy"""
+    with Image.open(image_path) as image:
+        # A multi-page TIFF would add pages to a list run, so it gets a copy of its first frame
+        if max(image.size) <= OCR_MAX_DIMENSION and getattr(image, 'n_frames', 1) == 1:
+            return os.path.abspath(image_path)
+    cv2.imwrite(copy_path, load_ocr_pixels(image_path))
+    return copy_path
+
+def ocr_image_list(image_paths):
+    """OCR several images in one Tesseract run, returning one text per image"""
+    if _worker_tess_api is not None:
+        # The model is already loaded in this process, so there is no startup to amortize
+        return [ocr_image_file(path) for path in image_paths]
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Oversized photos are shrunk into the temporary directory first
+            entries = [ocr_list_entry(path, os.path.join(temp_dir, f'{i}.png')) for i, path in enumerate(image_paths)]
+            
+            # Tesseract treats a .txt input as a list of images, one path per line,
+            # so the language model is loaded once per batch rather than once per image
+            list_path = os.path.join(temp_dir, 'images.txt')
+            with open(list_path, 'w') as list_file:
+                list_file.write('\n'.join(entries))
+            
+            # Each page's text is terminated by a form feed, so n pages split into n + 1 pieces
+            pages = pytesseract.image_to_string(list_path, config=TESS_CONFIG).split('\x0c')
+        
+        # Any other count means the pages no longer line up with the files
+        if len(pages) != len(image_paths) + 1:
+            raise ValueError(f"expected {len(image_paths)} pages, got {len(pages) - 1}")
+        return pages[:len(image_paths)]
+    except Exception as e:
+        print(f"Batch OCR error, falling back to one image at a time: {e}")
+        return [ocr_image_file(path) for path in image_paths]
+
+@lru_cache(maxsize=None)
+def shared_font(size, weight="normal"):
+    """One CTkFont per size and weight, shared by every widget using it (call once the root window exists)"""
+    return ctk.CTkFont(size=size, weight=weight)
+
 class PersonFrame:
     """Class to represent a single person's data entry frame"""
     
+    __slots__ = ('parent_frame', 'person_number', 'frame', 'name_entry', 'born_entry', 'died_entry', 'remove_btn')
+    
     def __init__(self, parent_frame, person_number):
         self.parent_frame = parent_frame
         self.person_number = person_number
@@ -64,7 +320,7 @@ class PersonFrame:
         header_frame.grid_columnconfigure(0, weight=1)
         
         person_label = ctk.CTkLabel(header_frame, text=f"Person {self.person_number}", 
-                                  font=ctk.CTkFont(size=12, weight="bold"))
+                                  font=shared_font(12, "bold"))
         person_label.grid(row=0, column=0, sticky="w", padx=5, pady=5)
         
         # Remove button (only show if more than one person)
@@ -126,11 +382,16 @@ class BackendAPI:
     def __init__(self, base_url=BACKEND_URL):
         self.base_url = base_url
         self.session = requests.Session()
+        # Keep-alive connections to the backend, retried if the server is briefly unavailable
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
-    def health_check(self):
+    def health_check(self, timeout=0.5):
         """Check if backend is running"""
         try:
-            response = self.session.get(f"{self.base_url}/health")
+            response = self.session.get(f"{self.base_url}/health", timeout=timeout)
             return response.status_code == 200
         except:
             return False
@@ -138,11 +399,28 @@ class BackendAPI:
     def get_cemeteries(self):
         """Get all cemeteries"""
         try:
-            response = self.session.get(f"{self.base_url}/cemeteries")
-            return response.json() if response.status_code == 200 else []
+            cemeteries = []
+            url = f"{self.base_url}/cemeteries"
+            # The listing is paginated; follow Link rel="next" until the last page
+            while url:
+                response = self.session.get(url)
+                if response.status_code != 200:
+                    break
+                cemeteries.extend(response.json())
+                url = response.links.get('next', {}).get('url')
+            return cemeteries
         except:
             return []
     
+    def get_cemetery_by_name(self, name):
+        """Get the cemetery with exactly this name, or None"""
+        try:
+            response = self.session.get(f"{self.base_url}/cemeteries", params={'name': name})
+            cemeteries = response.json() if response.status_code == 200 else []
+            return cemeteries[0] if cemeteries else None
+        except:
+            return None
+    
     def create_cemetery(self, name, location="", description=""):
         """Create a new cemetery"""
         try:
@@ -182,16 +460,49 @@ class BackendAPI:
         except:
             return None
     
-    def upload_photo(self, plot_id, image_path, photo_type="headstone"):
-        """Upload a photo for a plot"""
+    def add_individuals_bulk(self, plot_id, individuals):
+        """Add several individuals (dicts of add_individual's fields) to a plot in one request"""
         try:
-            with open(image_path, 'rb') as f:
-                files = {'file': f}
-                data = {'photo_type': photo_type}
-                response = self.session.post(f"{self.base_url}/plots/{plot_id}/photos", files=files, data=data)
+            response = self.session.post(f"{self.base_url}/plots/{plot_id}/individuals/bulk",
+                                         json={"individuals": individuals})
             return response.json() if response.status_code == 201 else None
         except:
             return None
+    
+    def bulk_import(self, cemetery_id, items):
+        """Create plots, each with an optional individual, from {'plot': ..., 'individual': ...} items in one request"""
+        try:
+            response = self.session.post(f"{self.base_url}/cemeteries/{cemetery_id}/bulk-import",
+                                         json={"items": items})
+            return response.json() if response.status_code == 201 else None
+        except:
+            return None
+    
+    def post_file(self, url, file_path, data=None):
+        """POST a file as multipart/form-data, streaming it from disk instead of buffering it"""
+        content_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        with open(file_path, 'rb') as f:
+            fields = dict(data or {})
+            fields['file'] = (os.path.basename(file_path), f, content_type)
+            encoder = MultipartEncoder(fields=fields)
+            return self.session.post(url, data=encoder, headers={'Content-Type': encoder.content_type})
+    
+    def upload_photo(self, plot_id, image_path, photo_type="headstone",
+                     max_dim=UPLOAD_MAX_DIMENSION, quality=UPLOAD_JPEG_QUALITY):
+        """Upload a photo for a plot, sent as a smaller JPEG when re-encoding saves bytes"""
+        try:
+            url = f"{self.base_url}/plots/{plot_id}/photos"
+            data = {'photo_type': photo_type}
+            jpeg = encode_upload_jpeg(image_path, max_dim, quality)
+            
+            if jpeg is None or len(jpeg) >= os.path.getsize(image_path):
+                response = self.post_file(url, image_path, data)
+            else:
+                files = {'file': (Path(image_path).stem + '.jpg', jpeg, 'image/jpeg')}
+                response = self.session.post(url, files=files, data=data)
+            return response.json() if response.status_code in (201, 202) else None
+        except:
+            return None
 
 class ElysianScribe:
     def __init__(self):
@@ -201,16 +512,28 @@ class ElysianScribe:
         self.root.geometry("1600x900")
         self.root.minsize(1400, 800)
         
+        # In-process Tesseract for selection OCR (None when tesserocr isn't installed)
+        self.tess = create_tess_api()
+        
+        # OCR and HTTP jobs run one at a time on a worker thread; anything they need done
+        # to widgets comes back through result_q and is applied by _drain_results
+        self.job_q = queue.Queue()
+        self.result_q = queue.Queue()
+        threading.Thread(target=self._worker, daemon=True).start()
+        
         # Initialize backend API
         self.api = BackendAPI()
-        self.backend_connected = self.api.health_check()
+        self.backend_connected = False  # Until the startup health check answers (see on_health_checked)
         
         # Application state variables
         self.current_image_index = 0
         self.image_files = []
         self.current_image = None
         self.current_photo = None
-        self.original_image = None
+        self.preview_image = None  # current image as loaded, before any straightening
+        self.rotation_angle = 0  # total straightening applied to preview_image, in degrees
+        self.unrotated_size = None  # size current_image had before that rotation
+        self.photo_cache = OrderedDict()  # (path, mtime_ns, canvas size) -> (image, PhotoImage)
         self.map_image = None
         self.map_photo = None
         self.current_cemetery = None
@@ -226,6 +549,10 @@ class ElysianScribe:
         self.straightening_points = []
         self.straightening_lines = []
         
+        # Image navigator buttons, and which of them is highlighted
+        self.navigator_buttons = []
+        self.highlighted_index = 0
+        
         # Person frames management
         self.person_frames = []
         self.person_counter = 1
@@ -236,10 +563,47 @@ class ElysianScribe:
         
         # Initialize the GUI
         self.setup_gui()
+        self.root.after(50, self._drain_results)
+        
+        # Check the backend on the worker so an unreachable one doesn't hold up the window
+        self.run_in_background(self.api.health_check, self.on_health_checked)
         
         # Bind window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
+    def run_in_background(self, work, on_done=None, on_error=None):
+        """Queue work() for the worker thread; on_done(result) or on_error(exception) then runs on the Tk thread"""
+        self.job_q.put((work, on_done, on_error))
+    
+    def call_in_ui(self, callback, *args, **kwargs):
+        """Schedule callback(*args, **kwargs) on the Tk thread; safe to call from the worker"""
+        self.result_q.put(partial(callback, *args, **kwargs))
+    
+    def _worker(self):
+        """Run queued jobs off the Tk main loop"""
+        while True:
+            work, on_done, on_error = self.job_q.get()
+            try:
+                result = work()
+            except Exception as e:
+                if on_error:
+                    self.call_in_ui(on_error, e)
+                else:
+                    print(f"Background job failed: {e}")
+            else:
+                if on_done:
+                    self.call_in_ui(on_done, result)
+    
+    def _drain_results(self):
+        """Apply queued widget updates from the worker, then poll again"""
+        while not self.result_q.empty():
+            callback = self.result_q.get_nowait()
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error applying background result: {e}")
+        self.root.after(50, self._drain_results)
+    
     def setup_gui(self):
         """Set up the main GUI layout"""
         # Configure grid weights for responsive layout
@@ -258,21 +622,20 @@ class ElysianScribe:
         self.left_frame = ctk.CTkFrame(self.root)
         self.left_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
         self.left_frame.grid_columnconfigure(0, weight=1)
-        self.left_frame.grid_rowconfigure(2, weight=1)
+        # Only the map preview (row 10) stretches; the map link below it keeps its natural height
+        self.left_frame.grid_rowconfigure(10, weight=1)
         
-        # Backend status
-        status_color = "green" if self.backend_connected else "red"
-        status_text = "Backend Connected" if self.backend_connected else "Backend Disconnected"
+        # Backend status, set by on_health_checked
         self.backend_status = ctk.CTkLabel(
             self.left_frame, 
-            text=status_text, 
-            font=ctk.CTkFont(size=12, weight="bold"),
-            text_color=status_color
+            text="Checking Backend...", 
+            font=shared_font(12, "bold"),
+            text_color="gray"
         )
         self.backend_status.grid(row=0, column=0, pady=(10, 5))
         
         # Cemetery selection
-        cemetery_label = ctk.CTkLabel(self.left_frame, text="Cemetery:", font=ctk.CTkFont(size=14, weight="bold"))
+        cemetery_label = ctk.CTkLabel(self.left_frame, text="Cemetery:", font=shared_font(14, "bold"))
         cemetery_label.grid(row=1, column=0, pady=(10, 5), sticky="w", padx=10)
         
         self.cemetery_var = ctk.StringVar()
@@ -338,20 +701,20 @@ class ElysianScribe:
         self.batch_ocr_btn.grid(row=7, column=0, pady=5)
         
         # Map display area
-        map_title = ctk.CTkLabel(self.left_frame, text="Cemetery Map", font=ctk.CTkFont(size=14, weight="bold"))
+        map_title = ctk.CTkLabel(self.left_frame, text="Cemetery Map", font=shared_font(14, "bold"))
         map_title.grid(row=8, column=0, pady=(20, 5))
         
         # Map status indicator
         self.map_status_label = ctk.CTkLabel(
             self.left_frame, 
             text="📍 No GPS coordinates set",
-            font=ctk.CTkFont(size=10),
+            font=shared_font(10),
             text_color="gray"
         )
         self.map_status_label.grid(row=9, column=0, pady=5)
         
         self.map_label = ctk.CTkLabel(self.left_frame, text="No map loaded", width=300, height=300)
-        self.map_label.grid(row=5, column=0, padx=10, pady=5, sticky="nsew")
+        self.map_label.grid(row=10, column=0, padx=10, pady=5, sticky="nsew")
         
         # Load map button
         self.load_map_btn = ctk.CTkButton(
@@ -360,10 +723,7 @@ class ElysianScribe:
             command=self.load_map,
             width=200
         )
-        self.load_map_btn.grid(row=6, column=0, pady=10)
-        
-        # Load cemeteries on startup
-        self.load_cemeteries()
+        self.load_map_btn.grid(row=11, column=0, pady=10)
     
     def create_center_frame(self):
         """Create the center frame for image workstation"""
@@ -373,14 +733,14 @@ class ElysianScribe:
         self.center_frame.grid_rowconfigure(1, weight=1)
         
         # Image Navigator
-        nav_title = ctk.CTkLabel(self.center_frame, text="Image Navigator", font=ctk.CTkFont(size=14, weight="bold"))
+        nav_title = ctk.CTkLabel(self.center_frame, text="Image Navigator", font=shared_font(14, "bold"))
         nav_title.grid(row=0, column=0, pady=(10, 5), sticky="w", padx=10)
         
         self.image_navigator = ctk.CTkScrollableFrame(self.center_frame, width=500, height=100)
         self.image_navigator.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="ew")
         
         # Image Viewer
-        viewer_title = ctk.CTkLabel(self.center_frame, text="Image Viewer", font=ctk.CTkFont(size=14, weight="bold"))
+        viewer_title = ctk.CTkLabel(self.center_frame, text="Image Viewer", font=shared_font(14, "bold"))
         viewer_title.grid(row=2, column=0, pady=(10, 5), sticky="w", padx=10)
         
         # Canvas for image display and selection
@@ -393,6 +753,14 @@ class ElysianScribe:
         )
         self.canvas.grid(row=3, column=0, padx=10, pady=5, sticky="nsew")
         
+        # A single image item is reused for every displayed image (see show_current_image)
+        self.canvas_image_id = self.canvas.create_image(0, 0, anchor="center")
+        
+        # Canvas size as of the last <Configure>, so displaying an image doesn't query Tk
+        # (the default covers images shown before the canvas is first rendered)
+        self.canvas_size = (500, 400)
+        self.canvas.bind("<Configure>", self.on_canvas_resize)
+        
         # Bind mouse events for selection and straightening
         self.canvas.bind("<Button-1>", self.on_canvas_click)
         self.canvas.bind("<B1-Motion>", self.update_selection)
@@ -429,7 +797,7 @@ class ElysianScribe:
         self.instructions_label = ctk.CTkLabel(
             controls_frame, 
             text="Click and drag to select text area for OCR",
-            font=ctk.CTkFont(size=10)
+            font=shared_font(10)
         )
         self.instructions_label.grid(row=0, column=2, padx=5)
     
@@ -440,7 +808,7 @@ class ElysianScribe:
         self.right_frame.grid_columnconfigure(0, weight=1)
         
         # Data entry title
-        data_title = ctk.CTkLabel(self.right_frame, text="Data Entry", font=ctk.CTkFont(size=16, weight="bold"))
+        data_title = ctk.CTkLabel(self.right_frame, text="Data Entry", font=shared_font(16, "bold"))
         data_title.grid(row=0, column=0, pady=(10, 5))
         
         # Plot Location
@@ -455,7 +823,7 @@ class ElysianScribe:
         
         # Individuals on this Plot section
         individuals_label = ctk.CTkLabel(self.right_frame, text="Individuals on this Plot:", 
-                                       font=ctk.CTkFont(size=14, weight="bold"))
+                                       font=shared_font(14, "bold"))
         individuals_label.grid(row=5, column=0, sticky="w", padx=10, pady=(10, 5))
         
         # Scrollable frame for person entries
@@ -520,12 +888,23 @@ class ElysianScribe:
         self.local_save_btn.grid(row=13, column=0, padx=10, pady=5)
         
         # Status label
-        self.status_label = ctk.CTkLabel(self.right_frame, text="No images loaded", font=ctk.CTkFont(size=12))
+        self.status_label = ctk.CTkLabel(self.right_frame, text="No images loaded", font=shared_font(12))
         self.status_label.grid(row=14, column=0, pady=10)
         
         # Initialize with one person frame
         self.add_person()
     
+    def on_health_checked(self, connected):
+        """Show the startup health check result, and load cemeteries if the backend is up"""
+        self.backend_connected = connected
+        self.backend_status.configure(
+            text="Backend Connected" if connected else "Backend Disconnected",
+            text_color="green" if connected else "red"
+        )
+        
+        # Load cemeteries on startup
+        self.load_cemeteries()
+    
     def load_cemeteries(self):
         """Load cemeteries from backend"""
         if not self.backend_connected:
@@ -577,13 +956,13 @@ class ElysianScribe:
         dialog.geometry(f"500x300+{x}+{y}")
         
         # Address input
-        ctk.CTkLabel(dialog, text="Enter cemetery address:", font=ctk.CTkFont(size=14, weight="bold")).pack(pady=10)
+        ctk.CTkLabel(dialog, text="Enter cemetery address:", font=shared_font(14, "bold")).pack(pady=10)
         
         address_entry = ctk.CTkEntry(dialog, width=400, placeholder_text="e.g., 123 Cemetery Road, City, State")
         address_entry.pack(pady=10)
         
         # Manual coordinates option
-        ctk.CTkLabel(dialog, text="OR enter GPS coordinates manually:", font=ctk.CTkFont(size=12)).pack(pady=(20,5))
+        ctk.CTkLabel(dialog, text="OR enter GPS coordinates manually:", font=shared_font(12)).pack(pady=(20,5))
         
         coord_frame = ctk.CTkFrame(dialog)
         coord_frame.pack(pady=10)
@@ -607,7 +986,7 @@ class ElysianScribe:
                 return
             
             # Show progress
-            progress_label = ctk.CTkLabel(dialog, text="Looking up GPS coordinates...", font=ctk.CTkFont(size=12))
+            progress_label = ctk.CTkLabel(dialog, text="Looking up GPS coordinates...", font=shared_font(12))
             progress_label.pack(pady=5)
             dialog.update()
             
@@ -712,12 +1091,11 @@ class ElysianScribe:
         
         if file_path and self.backend_connected:
             try:
-                with open(file_path, 'rb') as f:
-                    files = {'file': f}
-                    response = self.api.session.post(
-                        f"{self.api.base_url}/cemeteries/{self.current_cemetery['id']}/import-google-earth",
-                        files=files
-                    )
+                # Streamed from disk, so large KMZs aren't read into memory
+                response = self.api.post_file(
+                    f"{self.api.base_url}/cemeteries/{self.current_cemetery['id']}/import-google-earth",
+                    file_path
+                )
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -802,15 +1180,15 @@ class ElysianScribe:
             if hasattr(self, 'map_display_label'):
                 self.map_display_label.destroy()
             
-            # Create map display area
+            # Create map display area, in its own row below the Load Map button
             self.map_display_label = ctk.CTkLabel(
                 self.left_frame,
                 text=f"🗺️ Map Created!\nClick to open in browser",
-                font=ctk.CTkFont(size=12),
+                font=shared_font(12),
                 cursor="hand2",
                 text_color="blue"
             )
-            self.map_display_label.grid(row=10, column=0, pady=10)
+            self.map_display_label.grid(row=12, column=0, pady=10)
             
             # Make it clickable
             def open_map():
@@ -837,12 +1215,7 @@ class ElysianScribe:
             return
         
         # Get all image files
-        image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'}
-        image_files = []
-        
-        for file in os.listdir(folder_path):
-            if Path(file).suffix.lower() in image_extensions:
-                image_files.append(os.path.join(folder_path, file))
+        image_files = list_image_files(folder_path)
         
         if not image_files:
             messagebox.showwarning("Warning", "No image files found in the selected folder")
@@ -863,7 +1236,7 @@ class ElysianScribe:
         
         # Progress elements
         ctk.CTkLabel(progress_dialog, text="Auto Batch OCR Processing", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+                    font=shared_font(16, "bold")).pack(pady=10)
         
         progress_label = ctk.CTkLabel(progress_dialog, text=f"Processing {len(image_files)} images...")
         progress_label.pack(pady=5)
@@ -879,35 +1252,52 @@ class ElysianScribe:
         # Process images
         def process_images():
             results = []
+            import_items = []
             successful = 0
             failed = 0
             
-            for i, image_path in enumerate(image_files):
-                try:
-                    # Update progress
-                    progress = (i + 1) / len(image_files)
-                    progress_bar.set(progress)
-                    progress_label.configure(text=f"Processing {i+1}/{len(image_files)}: {os.path.basename(image_path)}")
-                    progress_dialog.update()
-                    
-                    # Process image with OCR
-                    result = self.process_single_image_ocr(image_path)
-                    
-                    if result:
-                        successful += 1
-                        results.append(f"✅ {os.path.basename(image_path)}: {result.get('name', 'Unknown')}")
+            # Batches are OCR'd in parallel across processes, each with one Tesseract run; they
+            # are capped at OCR_BATCH_SIZE but kept small enough to give every worker some work
+            workers = os.cpu_count() or 1
+            batch_size = max(1, min(OCR_BATCH_SIZE, -(-len(image_files) // workers)))
+            batches = [image_files[start:start + batch_size] for start in range(0, len(image_files), batch_size)]
+            self.call_in_ui(progress_label.configure, text=f"Processing {len(image_files)} images on {workers} workers...")
+            
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_ocr_worker) as executor:
+                # map() returns batches in order, so results line up with image_files
+                ocr_texts = (text for texts in executor.map(ocr_image_list, batches) for text in texts)
+                
+                for i, (image_path, extracted_text) in enumerate(zip(image_files, ocr_texts)):
+                    try:
+                        # Update progress
+                        progress = (i + 1) / len(image_files)
+                        self.call_in_ui(progress_bar.set, progress)
                         
-                        # Save to backend if connected
-                        if self.backend_connected:
-                            self.save_ocr_result_to_backend(result, image_path)
-                    else:
-                        failed += 1
-                        results.append(f"❌ {os.path.basename(image_path)}: OCR failed")
+                        result = self.build_ocr_result(image_path, extracted_text)
                         
-                except Exception as e:
-                    failed += 1
-                    results.append(f"❌ {os.path.basename(image_path)}: Error - {str(e)}")
+                        if result:
+                            successful += 1
+                            results.append(f"✅ {os.path.basename(image_path)}: {result.get('name', 'Unknown')}")
+                            
+                            import_items.append(self.build_import_item(result, image_path))
+                        else:
+                            failed += 1
+                            results.append(f"❌ {os.path.basename(image_path)}: OCR failed")
+                            
+                    except Exception as e:
+                        failed += 1
+                        results.append(f"❌ {os.path.basename(image_path)}: Error - {str(e)}")
             
+            # Save to backend if connected, IMPORT_BATCH_SIZE records per request
+            if self.backend_connected and self.current_cemetery and import_items:
+                self.call_in_ui(progress_label.configure, text=f"Saving {len(import_items)} records to backend...")
+                items = iter(import_items)
+                while batch := list(islice(items, IMPORT_BATCH_SIZE)):
+                    self.save_import_batch(batch)
+            
+            self.call_in_ui(show_summary, results, successful, failed)
+        
+        def show_summary(results, successful, failed):
             # Update results
             results_text.delete("1.0", "end")
             results_text.insert("1.0", f"Batch OCR Complete!\n\n")
@@ -923,54 +1313,45 @@ class ElysianScribe:
                                     command=progress_dialog.destroy, width=100)
             close_btn.pack(pady=10)
         
-        # Start processing in a separate thread
-        import threading
-        processing_thread = threading.Thread(target=process_images)
-        processing_thread.daemon = True
-        processing_thread.start()
+        def show_error(e):
+            progress_label.configure(text=f"Batch OCR failed: {str(e)}")
+            ctk.CTkButton(progress_dialog, text="Close", command=progress_dialog.destroy, width=100).pack(pady=10)
+        
+        # Process on the worker thread; widget updates are handed back via call_in_ui
+        self.run_in_background(process_images, on_error=show_error)
     
     def process_single_image_ocr(self, image_path):
         """Process a single image with OCR and return extracted data"""
-        try:
-            # Load image
-            image = Image.open(image_path)
-            
-            # Run OCR on entire image
-            extracted_text = pytesseract.image_to_string(image)
-            
-            if not extracted_text.strip():
-                return None
-            
-            # Parse the text to extract name, dates, etc.
-            parsed_data = self.parse_ocr_text(extracted_text)
-            
-            return {
-                'image_path': image_path,
-                'extracted_text': extracted_text,
-                'name': parsed_data.get('name', 'Unknown'),
-                'born_date': parsed_data.get('born_date'),
-                'died_date': parsed_data.get('died_date'),
-                'epitaph': parsed_data.get('epitaph', '')
-            }
-            
-        except Exception as e:
-            print(f"Error processing {image_path}: {e}")
+        return self.build_ocr_result(image_path, ocr_image_file(image_path))
+    
+    def build_ocr_result(self, image_path, extracted_text):
+        """Turn an image's OCR text into extracted data, or None if there is no text"""
+        if not extracted_text.strip():
             return None
+        
+        # Parse the text to extract name, dates, etc.
+        parsed_data = self.parse_ocr_text(extracted_text)
+        
+        return {
+            'image_path': image_path,
+            'extracted_text': extracted_text,
+            'name': parsed_data.get('name', 'Unknown'),
+            'born_date': parsed_data.get('born_date'),
+            'died_date': parsed_data.get('died_date'),
+            'epitaph': parsed_data.get('epitaph', '')
+        }
     
     def parse_ocr_text(self, text):
         """Parse OCR text to extract structured data"""
-        import re
-        
         # Clean up text
         text = text.strip()
         
         # Try to extract name (usually the first line or largest text)
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines = [stripped for line in text.splitlines() if (stripped := line.strip())]
         name = lines[0] if lines else 'Unknown'
         
         # Try to extract dates
-        date_pattern = r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4})\b'
-        dates = re.findall(date_pattern, text)
+        dates = _DATE_RE.findall(text)
         
         born_date = None
         died_date = None
@@ -995,58 +1376,39 @@ class ElysianScribe:
             'epitaph': epitaph
         }
     
-    def save_ocr_result_to_backend(self, result, image_path):
-        """Save OCR result to backend database"""
-        if not self.backend_connected or not self.current_cemetery:
-            return
-        
-        try:
-            # Create a plot for this image
-            plot_data = {
+    def build_import_item(self, result, image_path):
+        """Bulk-import item (a plot and its individual) for an OCR result"""
+        return {
+            'plot': {
                 'plot_number': f"AUTO-{os.path.basename(image_path)}",
                 'section': 'Auto-OCR',
                 'row': 'Batch'
+            },
+            'individual': {
+                'name': result['name'],
+                'born_date': result['born_date'],
+                'died_date': result['died_date'],
+                'epitaph': result['epitaph']
             }
-            
-            # Create plot
-            plot_response = self.api.session.post(
-                f"{self.api.base_url}/cemeteries/{self.current_cemetery['id']}/plots",
-                json=plot_data
-            )
-            
-            if plot_response.status_code == 201:
-                plot_id = plot_response.json()['id']
-                
-                # Add individual
-                individual_data = {
-                    'name': result['name'],
-                    'born_date': result['born_date'],
-                    'died_date': result['died_date'],
-                    'epitaph': result['epitaph']
-                }
-                
-                individual_response = self.api.session.post(
-                    f"{self.api.base_url}/plots/{plot_id}/individuals",
-                    json=individual_data
-                )
-                
-                if individual_response.status_code == 201:
-                    print(f"✅ Saved {result['name']} to database")
-                else:
-                    print(f"❌ Failed to save individual: {individual_response.text}")
-            else:
-                print(f"❌ Failed to create plot: {plot_response.text}")
-                
-        except Exception as e:
-            print(f"❌ Error saving to backend: {e}")
+        }
+    
+    def save_import_batch(self, items):
+        """Save OCR results to the backend database with one bulk-import request"""
+        response = self.api.bulk_import(self.current_cemetery['id'], items)
+        if response is None:
+            print(f"❌ Failed to save {len(items)} records to backend")
+            return
+        
+        print(f"✅ {response['message']}")
+        for error in response['errors']:
+            print(f"❌ Failed to save {items[error['index']]['plot']['plot_number']}: {error['error']}")
     
     def on_cemetery_selected(self, cemetery_name):
         """Handle cemetery selection"""
         if not self.backend_connected:
             return
         
-        cemeteries = self.api.get_cemeteries()
-        self.current_cemetery = next((c for c in cemeteries if c['name'] == cemetery_name), None)
+        self.current_cemetery = self.api.get_cemetery_by_name(cemetery_name)
         
         if self.current_cemetery:
             print(f"Selected cemetery: {cemetery_name} (ID: {self.current_cemetery['id']})")
@@ -1091,9 +1453,9 @@ class ElysianScribe:
         
         if file_path:
             try:
-                self.map_image = Image.open(file_path)
+                self.map_image = load_image(file_path)
                 # Resize map to fit the label while maintaining aspect ratio
-                self.map_image.thumbnail((300, 300), Image.Resampling.LANCZOS)
+                self.map_image = resize_image(self.map_image, fit_size(*self.map_image.size, 300, 300))
                 self.map_photo = ImageTk.PhotoImage(self.map_image)
                 self.map_label.configure(image=self.map_photo, text="")
             except Exception as e:
@@ -1105,12 +1467,7 @@ class ElysianScribe:
         
         if directory:
             # Get all image files from the directory
-            image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'}
-            self.image_files = []
-            
-            for file_path in Path(directory).iterdir():
-                if file_path.suffix.lower() in image_extensions:
-                    self.image_files.append(file_path)
+            self.image_files = [Path(path) for path in list_image_files(directory)]
             
             if self.image_files:
                 self.current_image_index = 0
@@ -1128,6 +1485,7 @@ class ElysianScribe:
             widget.destroy()
         
         # Add clickable buttons for each image
+        self.navigator_buttons = []
         for i, image_path in enumerate(self.image_files):
             btn = ctk.CTkButton(
                 self.image_navigator,
@@ -1138,6 +1496,18 @@ class ElysianScribe:
                 fg_color="gray" if i != self.current_image_index else "blue"
             )
             btn.pack(fill="x", padx=5, pady=2)
+            self.navigator_buttons.append(btn)
+        self.highlighted_index = self.current_image_index
+    
+    def update_image_navigator(self):
+        """Move the navigator highlight to the current image, recoloring just the two buttons involved"""
+        if self.highlighted_index == self.current_image_index:
+            return
+        
+        if self.highlighted_index < len(self.navigator_buttons):
+            self.navigator_buttons[self.highlighted_index].configure(fg_color="gray")
+        self.navigator_buttons[self.current_image_index].configure(fg_color="blue")
+        self.highlighted_index = self.current_image_index
     
     def select_image_by_index(self, index):
         """Select an image by its index in the navigator"""
@@ -1145,7 +1515,7 @@ class ElysianScribe:
             self.current_image_index = index
             self.load_current_image()
             self.update_status()
-            self.populate_image_navigator()  # Refresh to update button colors
+            self.update_image_navigator()  # Refresh to update button colors
             self.clear_form()
     
     def load_current_image(self):
@@ -1155,32 +1525,26 @@ class ElysianScribe:
         
         try:
             image_path = self.image_files[self.current_image_index]
-            self.original_image = Image.open(image_path)
-            self.current_image = self.original_image.copy()
             
             # Resize image to fit canvas while maintaining aspect ratio
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            
-            if canvas_width <= 1 or canvas_height <= 1:
-                # Canvas not yet rendered, use default size
-                canvas_width, canvas_height = 500, 400
-            
-            # Calculate scaling to fit image in canvas
-            img_width, img_height = self.current_image.size
-            scale_x = canvas_width / img_width
-            scale_y = canvas_height / img_height
-            scale = min(scale_x, scale_y, 1.0)  # Don't scale up
-            
-            new_width = int(img_width * scale)
-            new_height = int(img_height * scale)
+            canvas_width, canvas_height = self.canvas_size
             
-            self.current_image = self.current_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            self.current_photo = ImageTk.PhotoImage(self.current_image)
+            # Recently viewed images keep their fitted image and PhotoImage, so flipping back and
+            # forth neither decodes nor re-uploads them
+            key = (str(image_path), os.stat(image_path).st_mtime_ns, canvas_width, canvas_height)
+            if key in self.photo_cache:
+                self.photo_cache.move_to_end(key)
+            else:
+                image = load_display_image(*key)
+                self.photo_cache[key] = (image, ImageTk.PhotoImage(image))
+                if len(self.photo_cache) > PHOTO_CACHE_SIZE:
+                    self.photo_cache.popitem(last=False)
             
-            # Clear canvas and display image
-            self.canvas.delete("all")
-            self.canvas.create_image(canvas_width//2, canvas_height//2, image=self.current_photo, anchor="center")
+            self.current_image, photo = self.photo_cache[key]
+            self.preview_image = self.current_image
+            self.rotation_angle = 0
+            self.unrotated_size = self.current_image.size
+            self.show_current_image(photo)
             
             # Clear selection and straightening
             self.selection_start = None
@@ -1192,6 +1556,20 @@ class ElysianScribe:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load image: {str(e)}")
     
+    def show_current_image(self, photo=None):
+        """Display current_image (or its already-made PhotoImage) centered on the canvas by
+        retargeting the existing image item"""
+        # current_photo keeps the PhotoImage referenced; Tk only holds it by name
+        canvas_width, canvas_height = self.canvas_size
+        self.current_photo = photo if photo is not None else ImageTk.PhotoImage(self.current_image)
+        self.canvas.coords(self.canvas_image_id, canvas_width//2, canvas_height//2)
+        self.canvas.itemconfig(self.canvas_image_id, image=self.current_photo)
+        
+        # A selection drawn over the previous image no longer applies
+        if self.selection_rect:
+            self.canvas.delete(self.selection_rect)
+            self.selection_rect = None
+    
     def toggle_straightening_mode(self):
         """Toggle straightening mode on/off"""
         self.straightening_mode = not self.straightening_mode
@@ -1210,6 +1588,11 @@ class ElysianScribe:
                 self.canvas.delete(line)
             self.straightening_lines = []
     
+    def on_canvas_resize(self, event):
+        """Track the canvas size and keep the displayed image centered in it"""
+        self.canvas_size = (event.width, event.height)
+        self.canvas.coords(self.canvas_image_id, event.width//2, event.height//2)
+    
     def on_canvas_click(self, event):
         """Handle canvas click events for both selection and straightening"""
         if self.straightening_mode:
@@ -1262,33 +1645,25 @@ class ElysianScribe:
             # Calculate angle in degrees
             angle = math.degrees(math.atan2(y2 - y1, x2 - x1))
             
-            # Rotate the original image
-            rotated_image = self.original_image.rotate(-angle, expand=True, fillcolor='white')
-            
-            # Update current image
-            self.current_image = rotated_image
-            
-            # Resize to fit canvas
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            
-            if canvas_width <= 1 or canvas_height <= 1:
-                canvas_width, canvas_height = 500, 400
-            
-            img_width, img_height = self.current_image.size
-            scale_x = canvas_width / img_width
-            scale_y = canvas_height / img_height
-            scale = min(scale_x, scale_y, 1.0)
-            
-            new_width = int(img_width * scale)
-            new_height = int(img_height * scale)
+            # The line was drawn on the image as shown, so this adds to any earlier straightening;
+            # the unrotated preview is rotated by the total, never the full-size original
+            self.rotation_angle -= angle
             
-            self.current_image = self.current_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            self.current_photo = ImageTk.PhotoImage(self.current_image)
+            # Shrink the preview so its rotated bounding box fits the canvas, then rotate it
+            width, height = self.preview_image.size
+            cos = abs(math.cos(math.radians(self.rotation_angle)))
+            sin = abs(math.sin(math.radians(self.rotation_angle)))
+            canvas_width, canvas_height = self.canvas_size
+            scale = min(canvas_width / (width * cos + height * sin),
+                        canvas_height / (width * sin + height * cos), 1.0)
+            image = self.preview_image
+            if scale < 1:
+                image = resize_image(image, (max(1, int(width * scale)), max(1, int(height * scale))))
             
-            # Update canvas
-            self.canvas.delete("all")
-            self.canvas.create_image(canvas_width//2, canvas_height//2, image=self.current_photo, anchor="center")
+            # Update current image
+            self.unrotated_size = image.size
+            self.current_image = rotate_image(image, self.rotation_angle)
+            self.show_current_image()
             
             # Exit straightening mode
             self.toggle_straightening_mode()
@@ -1301,18 +1676,23 @@ class ElysianScribe:
     def start_selection(self, event):
         """Start drawing selection rectangle"""
         self.selection_start = (event.x, event.y)
+        
+        # The rectangle is created once and then only moved, both here and while dragging
         if self.selection_rect:
-            self.canvas.delete(self.selection_rect)
+            self.canvas.coords(self.selection_rect, event.x, event.y, event.x, event.y)
+        else:
+            self.selection_rect = self.canvas.create_rectangle(
+                event.x, event.y, event.x, event.y,
+                outline="red", width=2
+            )
     
     def update_selection(self, event):
         """Update selection rectangle while dragging"""
         if self.selection_start and not self.straightening_mode:
-            if self.selection_rect:
-                self.canvas.delete(self.selection_rect)
-            self.selection_rect = self.canvas.create_rectangle(
+            self.canvas.coords(
+                self.selection_rect,
                 self.selection_start[0], self.selection_start[1],
-                event.x, event.y,
-                outline="red", width=2
+                event.x, event.y
             )
     
     def end_selection(self, event):
@@ -1336,8 +1716,7 @@ class ElysianScribe:
             y1, y2 = min(y1, y2), max(y1, y2)
             
             # Convert canvas coordinates to image coordinates
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
+            canvas_width, canvas_height = self.canvas_size
             
             # Calculate image position on canvas
             img_width, img_height = self.current_image.size
@@ -1350,20 +1729,38 @@ class ElysianScribe:
             img_x2 = min(img_width, x2 - img_x)
             img_y2 = min(img_height, y2 - img_y)
             
-            # Crop the image
-            cropped_image = self.current_image.crop((img_x1, img_y1, img_x2, img_y2))
+            if img_x2 <= img_x1 or img_y2 <= img_y1:
+                messagebox.showwarning("Warning", "The selection doesn't cover the image")
+                return
             
-            # Run OCR
-            ocr_text = pytesseract.image_to_string(cropped_image, lang='eng')
+        except Exception as e:
+            messagebox.showerror("Error", f"OCR failed: {str(e)}")
+            return
+        
+        image_path = str(self.image_files[self.current_image_index])
+        box = (img_x1, img_y1, img_x2, img_y2)
+        display_size, unrotated_size, angle = self.current_image.size, self.unrotated_size, self.rotation_angle
+        
+        def run_ocr():
+            # Crop the full-size original rather than the canvas preview, so Tesseract sees the
+            # lettering at full resolution; only the cropped area is rotated to match the display
+            original = load_gray_original(image_path, os.stat(image_path).st_mtime_ns)
+            cropped_pixels = crop_selection(original, box, display_size, unrotated_size, angle)
+            binarized = binarize_for_ocr(shrink_for_ocr(cropped_pixels))
             
-            # Display results
+            if self.tess is not None:
+                return tess_image_to_string(self.tess, binarized)
+            return pytesseract.image_to_string(binarized, lang='eng', config=TESS_CONFIG)
+        
+        def show_ocr_text(ocr_text):
             self.ocr_textbox.configure(state="normal")
             self.ocr_textbox.delete("1.0", "end")
             self.ocr_textbox.insert("1.0", ocr_text.strip())
             self.ocr_textbox.configure(state="disabled")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"OCR failed: {str(e)}")
+        
+        # Tesseract runs on the worker thread (the only user of self.tess) so the window stays responsive
+        self.run_in_background(run_ocr, show_ocr_text,
+                               lambda e: messagebox.showerror("Error", f"OCR failed: {str(e)}"))
     
     def previous_image(self):
         """Navigate to the previous image"""
@@ -1371,7 +1768,7 @@ class ElysianScribe:
             self.current_image_index -= 1
             self.load_current_image()
             self.update_status()
-            self.populate_image_navigator()
+            self.update_image_navigator()
             self.clear_form()
     
     def next_image(self):
@@ -1380,7 +1777,7 @@ class ElysianScribe:
             self.current_image_index += 1
             self.load_current_image()
             self.update_status()
-            self.populate_image_navigator()
+            self.update_image_navigator()
             self.clear_form()
     
     def clear_form(self):
@@ -1429,18 +1826,19 @@ class ElysianScribe:
             messagebox.showwarning("Warning", "Please enter at least one person's name")
             return
         
-        try:
+        cemetery_id = self.current_cemetery['id']
+        
+        def save():
             # Create plot in backend
             plot = self.api.create_plot(
-                self.current_cemetery['id'],
+                cemetery_id,
                 plot_location or filename,
                 latitude=None,  # Could be extracted from GPS data
                 longitude=None
             )
             
             if not plot:
-                messagebox.showerror("Error", "Failed to create plot in backend")
-                return
+                return None
             
             plot_id = plot['id']
             
@@ -1449,30 +1847,37 @@ class ElysianScribe:
             if photo_result:
                 print(f"Uploaded photo: {filename}")
             
-            # Add individuals
-            records_saved = 0
-            for person_data in valid_persons:
-                individual = self.api.add_individual(
-                    plot_id,
-                    person_data['name'],
-                    person_data['born'] if person_data['born'] else None,
-                    person_data['died'] if person_data['died'] else None,
-                    epitaph,
-                    "primary" if records_saved == 0 else "family"
-                )
-                
-                if individual:
-                    records_saved += 1
-                    print(f"Added individual: {person_data['name']}")
+            # Add all individuals in one request; the first is the primary, the rest family
+            individuals = self.api.add_individuals_bulk(plot_id, [
+                {
+                    "name": person_data['name'],
+                    "born_date": person_data['born'] or None,
+                    "died_date": person_data['died'] or None,
+                    "epitaph": epitaph,
+                    "relationship": "primary" if i == 0 else "family"
+                }
+                for i, person_data in enumerate(valid_persons)
+            ])
+            
+            for individual in individuals or []:
+                print(f"Added individual: {individual['name']}")
+            return len(individuals) if individuals else 0
+        
+        def on_saved(records_saved):
+            if records_saved is None:
+                messagebox.showerror("Error", "Failed to create plot in backend")
+                return
             
             # Show confirmation
             messagebox.showinfo("Success", f"Saved {records_saved} record(s) to backend for {filename}")
             
-            # Clear form for next entry
-            self.clear_form()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save to backend: {str(e)}")
+            # Clear form for next entry, unless the user has already moved on to another image
+            if self.image_files and self.image_files[self.current_image_index] == current_file:
+                self.clear_form()
+        
+        # The HTTP round-trips run on the worker thread
+        self.run_in_background(save, on_saved,
+                               lambda e: messagebox.showerror("Error", f"Failed to save to backend: {str(e)}"))
     
     def save_records(self):
         """Save records locally (fallback method)"""
@@ -1548,6 +1953,9 @@ class ElysianScribe:
     def on_closing(self):
         """Handle application closing"""
         self.save_data_to_csv()
+        if self.tess is not None:
+            # Queued behind any OCR still using the API on the worker
+            self.run_in_background(self.tess.End)
         self.root.destroy()
     
     def run(self):
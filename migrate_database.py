@@ -1,11 +1,21 @@
 """
 Database Migration Script
-Adds latitude and longitude fields to Cemetery table
+Adds latitude and longitude fields to Cemetery table, OCR status to Photo table
+and indexes on foreign keys and searched columns
 """
 
 import sqlite3
 import os
 
+# Indexes declared with index=True on the models (named as SQLAlchemy names them)
+INDEXES = [
+    ('ix_plot_plot_number', 'plot', 'plot_number'),
+    ('ix_individual_plot_id', 'individual', 'plot_id'),
+    ('ix_individual_name', 'individual', 'name'),
+    ('ix_photo_plot_id', 'photo', 'plot_id'),
+    ('ix_blueprint_cemetery_id', 'blueprint', 'cemetery_id'),
+]
+
 def migrate_database():
     """Add latitude and longitude fields to Cemetery table"""
     db_path = "backend/elysian_fields.db"
@@ -42,6 +52,20 @@ def migrate_database():
         else:
             print("✅ Longitude column already exists")
         
+        cursor.execute("PRAGMA table_info(photo)")
+        photo_columns = [column[1] for column in cursor.fetchall()]
+        
+        if 'ocr_status' not in photo_columns:
+            print("Adding ocr_status column to photo table...")
+            cursor.execute("ALTER TABLE photo ADD COLUMN ocr_status VARCHAR(20)")
+            print("✅ Added ocr_status column")
+        else:
+            print("✅ OCR status column already exists")
+        
+        for index_name, table, column in INDEXES:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({column})")
+        print(f"✅ Ensured {len(INDEXES)} indexes")
+        
         # Commit changes
         conn.commit()
         conn.close()